@@ -25,6 +25,9 @@ export DOLLAR='$'
 export FBM_GUI_PORT=8000
 export FBM_GUI_HOST=localhost
 
+# React build directory of the installed GUI, static assets are served by nginx
+export FBM_GUI_BUILD_DIR=$(python -c "import os, fedbiomed_gui; print(os.path.join(os.path.dirname(fedbiomed_gui.__file__), 'ui', 'build'))")
+
 # Set variable for nginx handling with/without specific domain
 if [ -z "$GUI_SERVER_NAME" ] ; then
   export SERVER_NAME_DIRECTIVE=
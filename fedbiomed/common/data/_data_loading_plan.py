@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, TypeVar, Type, Union, Optional
 from abc import ABC, abstractmethod
 from importlib import import_module
@@ -17,6 +18,24 @@ TDataLoadingPlan = TypeVar("TDataLoadingPlan", bound="DataLoadingPlan")
 TDataLoadingBlock = TypeVar("TDataLoadingBlock", bound="DataLoadingBlock")
 
 
+@lru_cache(maxsize=256)
+def _import_object(module_name: str, qualname: str) -> Any:
+    """Imports a module and resolves a (possibly nested) object within it.
+
+    Results are cached, as the same loading block classes and keys are resolved for every deserialization.
+
+    Args:
+        module_name: fully qualified name of the module
+        qualname: qualified name of the object within the module
+    Returns:
+        the resolved object
+    """
+    obj = import_module(module_name)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+
 class SerializationValidation:
     """Provide Validation capabilities for serializing/deserializing a [DataLoadingBlock] or [DataLoadingPlan].
 
@@ -322,8 +341,7 @@ class DataLoadingBlock(ABC):
            FedbiomedLoadingBlockError: if the instantiation process raised any exception.
         """
         try:
-            dlb_module = import_module(loading_block['loading_block_module'])
-            dlb = eval(f"dlb_module.{loading_block['loading_block_class']}()")
+            dlb = _import_object(loading_block['loading_block_module'], loading_block['loading_block_class'])()
         except Exception as e:
             msg = f"{ErrorNumbers.FB614.value}: could not instantiate DataLoadingBlock from the following metadata: " +\
                   f"{loading_block} because of {type(e).__name__}: {e}"
@@ -348,8 +366,7 @@ class DataLoadingBlock(ABC):
             DataLoadingBlockTypes: _description_
         """
         try:
-            keys = import_module(key_module)
-            loading_block_key = eval(f"keys.{key_classname}('{loading_block_key_str}')")
+            loading_block_key = _import_object(key_module, key_classname)(loading_block_key_str)
         except Exception as e:
             msg = f"{ErrorNumbers.FB615.value} Error deserializing loading block key " + \
                   f"{loading_block_key_str} with path {key_module}.{key_classname} " + \
@@ -620,7 +637,9 @@ class DataLoadingPlanMixin:
         if not isinstance(dlb_key, DataLoadingBlockTypes):
             raise FedbiomedDataLoadingPlanValueError(f"Key {dlb_key} is not of enum type DataLoadingBlockTypes"
                                                      f" in DataLoadingPlanMixin.apply_dlb")
-        if self._dlp is not None and dlb_key in self._dlp:
-            return self._dlp[dlb_key].apply(*args, **kwargs)
+        # single lookup: hashing enum keys is done in python
+        dlb = self._dlp.get(dlb_key) if self._dlp is not None else None
+        if dlb is not None:
+            return dlb.apply(*args, **kwargs)
         else:
             return default_ret_value
@@ -56,6 +56,24 @@ class Serializer:
 
         return ser
 
+    @classmethod
+    def dumps_buffer(cls, obj: Any) -> memoryview:
+        """Serialize data into a read-only view of MsgPack-encoded bytes.
+
+        Unlike `dumps`, the encoded data is not copied into a new `bytes`
+        object, which avoids holding two copies of large payloads in memory
+        when the data is only meant to be sliced (e.g. streamed by chunks).
+
+        Args:
+            obj: Data that needs encoding.
+
+        Returns:
+            Memory view over the MsgPack-encoded bytes of the input data.
+        """
+        packer = msgpack.Packer(default=cls._default, strict_types=True, autoreset=False)
+        packer.pack(obj)
+        return packer.getbuffer()
+
     @classmethod
     def dump(cls, obj: Any, path: str) -> None:
         """Serialize data into a MsgPack binary dump file.
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import math
 from typing import Dict, List, Mapping, Tuple, Union
 
 import torch
@@ -36,7 +37,8 @@ def federated_averaging(model_params: List[Dict[str, Union[torch.Tensor, np.ndar
                                               'the same number of elements that list of models.'
 
     # Compute proportions
-    proportions = [n_k / sum(weights) for n_k in weights]
+    total_weight = math.fsum(weights)
+    proportions = [n_k / total_weight for n_k in weights]
     return weighted_sum(model_params, proportions)
 
 
@@ -10,7 +10,7 @@ import os
 import uuid
 import tempfile
 import threading
-from typing import Any, Dict, Callable, Union, List, Optional
+from typing import Any, Dict, Callable, Union, List, Optional, Tuple
 
 import tabulate
 from python_minifier import minify
@@ -98,11 +98,20 @@ class Request:
 
         return True if self.reply or self.error else False
 
-    def send(self) -> None:
-        """Sends the request"""
+    def prepare_send(self) -> Tuple[NodeAgent, Message, Callable]:
+        """Prepares the request for being sent
+
+        Returns:
+            The node agent, the message and the reply callback to use for sending the request
+        """
         self._message.request_id = self._request_id
-        self._node.send(self._message, self.on_reply)
         self.status = RequestStatus.NO_REPLY_YET
+        return self._node, self._message, self.on_reply
+
+    def send(self) -> None:
+        """Sends the request"""
+        node, message, on_reply = self.prepare_send()
+        node.send(message, on_reply)
 
     def flush(self, stopped: bool) -> None:
         """Flushes the reply that has been processed
@@ -245,8 +254,8 @@ class FederatedRequest:
 
     def send(self) -> None:
         """Sends federated request"""
-        for req in self._requests:
-            req.send()
+        # Single submission to the communication thread for all the requests
+        NodeAgent.send_many([req.prepare_send() for req in self._requests])
 
     def wait(self) -> None:
         """Waits for the replies of the messages that are sent"""
@@ -566,16 +566,18 @@ class TaskListener(Listener):
             TaskRequest(node=f"{self._node_id}").to_proto(),
             timeout=GRPC_CLIENT_TASK_REQUEST_TIMEOUT,
         )
-        # Prepare reply
-        reply = bytes()
+        # Prepare reply: collect chunks and join them once the last one is received
+        chunks = []
         async for answer in iterator:
-            reply += answer.bytes_
+            chunks.append(answer.bytes_)
             if answer.size != answer.iteration:
                 continue
             else:
                 # Execute callback
                 logger.debug("New task received from researcher")
-                task = Serializer.loads(reply)
+                task = Serializer.loads(b"".join(chunks))
+                # Reset reply
+                chunks.clear()
 
                 # Guess ID of connected researcher, for un-authenticated connection
                 await self._update_id(task["researcher_id"])
@@ -584,9 +586,6 @@ class TaskListener(Listener):
                     # we could check the callback prototype
                     callback(task)
 
-                # Reset reply
-                reply = bytes()
-
 
 class Sender(Listener):
 
@@ -719,12 +718,14 @@ class Sender(Listener):
             A stream of researcher reply chunks
         """
 
-        reply = Serializer.dumps(message.to_dict())
-        chunk_range = range(0, len(reply), MAX_MESSAGE_BYTES_LENGTH)
-        for start, iter_ in zip(chunk_range, range(1, len(chunk_range) + 1)):
-            stop = start + MAX_MESSAGE_BYTES_LENGTH
+        reply = Serializer.dumps_buffer(message.to_dict())
+        nb_chunks = (len(reply) + MAX_MESSAGE_BYTES_LENGTH - 1) // MAX_MESSAGE_BYTES_LENGTH
+        for i in range(nb_chunks):
+            start = i * MAX_MESSAGE_BYTES_LENGTH
             yield TaskResult(
-                size=len(chunk_range), iteration=iter_, bytes_=reply[start:stop]
+                size=nb_chunks,
+                iteration=i + 1,
+                bytes_=bytes(reply[start:start + MAX_MESSAGE_BYTES_LENGTH]),
             ).to_proto()
 
     async def send(self, message: Message) -> None:
@@ -3,7 +3,7 @@ import copy
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Awaitable, Callable, Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 import grpc
 
@@ -106,7 +106,8 @@ class NodeAgentAsync:
 
         Returns:
             A coroutine to await for retrieving a list of: a task ; a number of send retries already done ;
-                the time of first sending attempt in seconds since epoch
+                the time of first sending attempt in seconds since epoch ; the serialized task or None
+                if not serialized yet
         """
         return self._queue.get()
 
@@ -158,6 +159,7 @@ class NodeAgentAsync:
         on_reply: Optional[Callable] = None,
         retry_count: int = 0,
         first_send_time: Optional[float] = None,
+        serialized: Optional[memoryview] = None,
     ) -> None:
         """Async function send message to researcher.
 
@@ -166,6 +168,8 @@ class NodeAgentAsync:
             on_reply: optional callback to execute when receiving message reply
             retry_count: number of retries already done for this message
             first_send_time: time of first send attempt for this message
+            serialized: optional message already serialized, eg when the same message
+                is sent to multiple nodes. If None, message is serialized when sent.
         """
 
         async with self._status_lock:
@@ -199,7 +203,7 @@ class NodeAgentAsync:
 
         if first_send_time is None:
             first_send_time = time.time()
-        await self._queue.put([message, retry_count, first_send_time])
+        await self._queue.put([message, retry_count, first_send_time, serialized])
 
     async def set_active(self) -> None:
         """Updates node status as active"""
@@ -283,6 +287,33 @@ class NodeAgent(NodeAgentAsync):
             self.send_async(message=message, on_reply=on_reply), self._loop
         )
 
+    @staticmethod
+    def send_many(items: List[Tuple["NodeAgent", Message, Optional[Callable]]]) -> None:
+        """Send messages to several nodes with a single submission per event loop.
+
+        Messages are sent concurrently: failing to send to a node is logged and does not
+        prevent sending to the other nodes.
+
+        Args:
+            items: list of node agent, message to send to the node and optional reply callback.
+        """
+        async def _send_many(loop_items: List[Tuple["NodeAgent", Message, Optional[Callable]]]):
+            results = await asyncio.gather(
+                *[agent.send_async(message=message, on_reply=on_reply) for agent, message, on_reply in loop_items],
+                return_exceptions=True
+            )
+            for (agent, _, _), result in zip(loop_items, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error while sending message to node {agent.id}: {result}")
+
+        # in practice, all node agents use the event loop of the gRPC server
+        items_by_loop = {}
+        for item in items:
+            items_by_loop.setdefault(item[0]._loop, []).append(item)
+
+        for loop, loop_items in items_by_loop.items():
+            asyncio.run_coroutine_threadsafe(_send_many(loop_items), loop)
+
 
 class AgentStore:
     """Stores node agents"""
@@ -304,6 +335,8 @@ class AgentStore:
 
         # protect read/write operations on self._node_agents
         self._store_lock = asyncio.Lock()
+        # set as soon as a first node agent is registered in the store
+        self._node_registered = asyncio.Event()
 
     async def retrieve(self, node_id: str) -> NodeAgent:
         """Retrieves a node agent for a given node ID.
@@ -325,9 +358,26 @@ class AgentStore:
                     id=node_id, loop=self._loop, on_forward=self._on_forward
                 )
                 self._node_agents.update({node_id: node})
+                self._node_registered.set()
 
         return node
 
+    async def wait_for_node(self, timeout: float) -> bool:
+        """Waits until at least one node agent is registered in the store.
+
+        Args:
+            timeout: maximum time in seconds to wait for a node registration
+
+        Returns:
+            True if a node agent is registered, False if timeout was reached
+        """
+        try:
+            await asyncio.wait_for(self._node_registered.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
     async def get_all(self) -> Dict[str, NodeAgent]:
         """Returns all node agents regardless of their status (ACTIVE, DISCONNECTED, ...).
 
@@ -3,6 +3,7 @@ import time
 import os
 from typing import Callable, Iterable, Any, Coroutine, Optional, List
 import threading
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 import asyncio
 import grpc
@@ -35,9 +36,11 @@ MAX_SEND_DURATION = 300
 
 server_setup_timeout = int(os.getenv('GRPC_SERVER_SETUP_TIMEOUT', 1))
 
-GRPC_SERVER_SETUP_TIMEOUT = GRPC_CLIENT_CONN_RETRY_TIMEOUT + server_setup_timeout
 MAX_GRPC_SERVER_SETUP_TIMEOUT = 20 * server_setup_timeout
 
+# default timeout in seconds for a call from another thread to complete in the gRPC server event loop
+GRPC_SERVER_CALL_TIMEOUT = 60
+
 
 class SSLCredentials:
     """Contains credentials for SSL certifcate of the gRPC server"""
@@ -96,7 +99,7 @@ class ResearcherServicer(researcher_pb2_grpc.ResearcherServiceServicer):
         task = None
         try:
             while True:
-                task, retry_count, first_send_time = await node_agent.get_task()
+                task, retry_count, first_send_time, task_bytes = await node_agent.get_task()
 
                 # Choice: mark task as de-queued as soon only if really sent
                 node_agent.task_done()
@@ -108,17 +111,22 @@ class ResearcherServicer(researcher_pb2_grpc.ResearcherServiceServicer):
                     task = None
                     logger.warning(f"Message to send is older than {MAX_SEND_DURATION} seconds. Discard message.")
 
-            task_bytes = Serializer.dumps(task.to_dict())
+            if task_bytes is None:
+                # serialize in the loop's default executor (shut down with the loop), so that the
+                # event loop keeps serving the other nodes while a large message is being packed
+                task_bytes = await asyncio.get_running_loop().run_in_executor(
+                    None, Serializer.dumps_buffer, task.to_dict()
+                )
 
-            chunk_range = range(0, len(task_bytes), MAX_MESSAGE_BYTES_LENGTH)
-            for start, iter_ in zip(chunk_range, range(1, len(chunk_range) + 1)):
-                stop = start + MAX_MESSAGE_BYTES_LENGTH
+            nb_chunks = (len(task_bytes) + MAX_MESSAGE_BYTES_LENGTH - 1) // MAX_MESSAGE_BYTES_LENGTH
+            for i in range(nb_chunks):
+                start = i * MAX_MESSAGE_BYTES_LENGTH
 
                 try:
                     yield TaskResponse(
-                        size=len(chunk_range),
-                        iteration=iter_,
-                        bytes_=task_bytes[start:stop]
+                        size=nb_chunks,
+                        iteration=i + 1,
+                        bytes_=bytes(task_bytes[start:start + MAX_MESSAGE_BYTES_LENGTH])
                     ).to_proto()
                 except GeneratorExit:
                     # schedule resend if task sending could not be completed
@@ -131,7 +139,8 @@ class ResearcherServicer(researcher_pb2_grpc.ResearcherServiceServicer):
                     # level failure in the while, but it is mitigated by the MAX_SEND_DURATION
                     if retry_count < MAX_SEND_RETRIES:
                         await node_agent.send_async(
-                            message=task, on_reply=None, retry_count=retry_count + 1, first_send_time=first_send_time
+                            message=task, on_reply=None, retry_count=retry_count + 1, first_send_time=first_send_time,
+                            serialized=task_bytes
                         )
                     else:
                         logger.warning(f"Message cannot be sent after {MAX_SEND_RETRIES} retries. Discard message.")
@@ -144,7 +153,8 @@ class ResearcherServicer(researcher_pb2_grpc.ResearcherServiceServicer):
                 # schedule resend if task was pulled from queue
                 if retry_count < MAX_SEND_RETRIES:
                     await node_agent.send_async(
-                        message=task, on_reply=None, retry_count=retry_count + 1, first_send_time=first_send_time
+                        message=task, on_reply=None, retry_count=retry_count + 1, first_send_time=first_send_time,
+                        serialized=task_bytes
                     )
                 else:
                     logger.warning(f"Message cannot be sent after {MAX_SEND_RETRIES} retries. Discard message.")
@@ -164,21 +174,23 @@ class ResearcherServicer(researcher_pb2_grpc.ResearcherServiceServicer):
             unused_context: Request service context
         """
 
-        reply = bytes()
+        # Collect chunks and join them once, avoids re-copying the whole reply for each chunk
+        chunks = []
         async for answer in request_iterator:
-            reply += answer.bytes_
+            chunks.append(answer.bytes_)
             if answer.size != answer.iteration:
                 continue
 
             # Deserialize message
-            message = Serializer.loads(reply)
+            message = await asyncio.get_running_loop().run_in_executor(
+                None, Serializer.loads, b"".join(chunks)
+            )
+            chunks.clear()
 
             # Replies are handled by node agent callbacks
             node = await self._agent_store.get(message["node_id"])
             await node.on_reply(message)
 
-            reply = bytes()
-
         return Empty()
 
 
@@ -249,6 +261,11 @@ class _GrpcAsyncServer:
                 ("grpc.max_send_message_length", 100 * 1024 * 1024),
                 ("grpc.max_receive_message_length", 100 * 1024 * 1024),
                 #
+                # Larger HTTP/2 frames and flow control window for streaming large models
+                # to/from many nodes with fewer WINDOW_UPDATE round trips
+                ("grpc.http2.max_frame_size", 4 * 1024 * 1024),
+                ("grpc.http2.lookahead_bytes", 16 * 1024 * 1024),
+                #
                 # Some references for configuring gRPC keepalive:
                 # https://github.com/grpc/proposal/blob/master/A8-client-side-keepalive.md
                 # https://github.com/grpc/proposal/blob/master/A9-server-side-conn-mgt.md
@@ -337,13 +354,33 @@ class _GrpcAsyncServer:
     async def broadcast(self, message: Message) -> None:
         """Broadcasts given message to all active clients.
 
+        The message is sent to every node even if sending to one of them fails.
+
         Args:
             message: Message to broadcast
+
+        Raises:
+            Exception: the first error raised while sending to a node, once all sends are done
         """
 
         agents = await self._agent_store.get_all()
-        for _, agent in agents.items():
-            await agent.send_async(message)
+        if not agents:
+            return
+
+        # Serialize once, the same bytes are then sent to every node
+        serialized = await asyncio.get_running_loop().run_in_executor(
+            None, Serializer.dumps_buffer, message.to_dict()
+        )
+        results = await asyncio.gather(
+            *[agent.send_async(message, serialized=serialized) for agent in agents.values()],
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for node_id, result in zip(agents.keys(), results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error while broadcasting message to node {node_id}: {result}")
+        if errors:
+            raise errors[0]
 
     async def get_node(self, node_id: str) -> Optional[NodeAgent]:
         """Returns given node
@@ -366,7 +403,19 @@ class _GrpcAsyncServer:
 
         agents = await self._agent_store.get_all()
 
-        return [node for node in agents.values()]
+        return list(agents.values())
+
+    async def wait_for_nodes(self, timeout: float) -> bool:
+        """Waits until at least one node connects to the server
+
+        Args:
+            timeout: maximum time in seconds to wait for a node
+
+        Returns:
+            True if a node is connected, False if timeout was reached
+        """
+
+        return await self._agent_store.wait_for_node(timeout)
 
 
 
@@ -380,10 +429,34 @@ class GrpcServer(_GrpcAsyncServer):
 
     Attributes:
         _thread: background thread of gRPC server
+        _call_timeout: maximum time in seconds for a call to complete in the gRPC server event loop
     """
 
     _thread: Optional[threading.Thread] = None
 
+    def __init__(
+            self,
+            host: str,
+            port: str,
+            on_message: Callable,
+            ssl: SSLCredentials,
+            debug: bool = False,
+            call_timeout: float = GRPC_SERVER_CALL_TIMEOUT,
+    ) -> None:
+        """Class constructor
+
+        Args:
+            host: server DNS name or IP address
+            port: server TCP port
+            on_message: Callback function to execute once a message received from the nodes
+            ssl: Ssl credentials.
+            debug: Activate debug mode for gRPC asyncio
+            call_timeout: maximum time in seconds for a call (eg send, broadcast) to complete in the
+                gRPC server event loop
+        """
+        super().__init__(host=host, port=port, on_message=on_message, ssl=ssl, debug=debug)
+        self._call_timeout = call_timeout
+
     def _run(self) -> None:
         """Runs asyncio application"""
         try:
@@ -394,35 +467,26 @@ class GrpcServer(_GrpcAsyncServer):
     def start(self) -> None:
         """Starts async GrpcServer """
 
+        t0 = time.monotonic()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
-        # FIXME: This implementation assumes that nodes will be able connect and server complete setup with this delay
         logger.info("Starting researcher service...")
 
+        logger.info(f'Waiting up to {MAX_GRPC_SERVER_SETUP_TIMEOUT}s for nodes to connect...')
+        deadline = t0 + MAX_GRPC_SERVER_SETUP_TIMEOUT
 
-        logger.info(f'Waiting {GRPC_SERVER_SETUP_TIMEOUT}s for nodes to connect...')
-        time.sleep(GRPC_SERVER_SETUP_TIMEOUT)
-
-        sleep_ = 0
-        while len(self.get_all_nodes()) == 0:
-
-            if sleep_ == 0:
-                logger.info(f"No nodes found, server will wait "
-                            f"{MAX_GRPC_SERVER_SETUP_TIMEOUT - GRPC_SERVER_SETUP_TIMEOUT} "
-                            "more seconds until a node creates connection.")
-
-            if sleep_ > MAX_GRPC_SERVER_SETUP_TIMEOUT - GRPC_SERVER_SETUP_TIMEOUT:
-                if len(self.get_all_nodes()) == 0:
-                    logger.warning("Server has not received connection from any remote nodes in "
-                                   f"MAX_GRPC_SERVER_SETUP_TIMEOUT: {MAX_GRPC_SERVER_SETUP_TIMEOUT} "
-                                   "This may effect the request created right after the server initialization. "
-                                   "However, server will keep running in the background so you can retry the "
-                                   "operations for sending requests to remote nodes until one receives.")
-                break
-
-            time.sleep(1)
-            sleep_ += 1
+        if not self._is_started.wait(timeout=MAX_GRPC_SERVER_SETUP_TIMEOUT) or \
+                not self.wait_for_nodes(timeout=max(0, deadline - time.monotonic())):
+            logger.warning("Server has not received connection from any remote nodes in "
+                           f"MAX_GRPC_SERVER_SETUP_TIMEOUT: {MAX_GRPC_SERVER_SETUP_TIMEOUT} "
+                           "This may effect the request created right after the server initialization. "
+                           "However, server will keep running in the background so you can retry the "
+                           "operations for sending requests to remote nodes until one receives.")
+        else:
+            # no grace period: requests are sent to the nodes registered so far, nodes
+            # connecting later are reached by the next requests
+            logger.info("Node(s) connected to the researcher service")
 
 
     def send(self, message: Message, node_id: str) -> None:
@@ -485,6 +549,27 @@ class GrpcServer(_GrpcAsyncServer):
 
         return self._run_threadsafe(super().get_all_nodes())
 
+    def wait_for_nodes(self, timeout: float) -> bool:
+        """Waits until at least one node connects to the server
+
+        Args:
+            timeout: maximum time in seconds to wait for a node
+
+        Returns:
+            True if a node is connected, False if timeout was reached
+
+        Raises:
+            FedbiomedCommunicationError: server is not started
+        """
+        if not self._is_started.is_set():
+            raise FedbiomedCommunicationError(
+                f"{ErrorNumbers.FB628}: Error while waiting for nodes to "
+                "connect: Communication client is not initialized.")
+
+        return self._run_threadsafe(
+            super().wait_for_nodes(timeout), timeout=timeout + self._call_timeout
+        )
+
     def get_node(self, node_id) -> Optional[NodeAgent]:
         """Returns given node
 
@@ -523,19 +608,32 @@ class GrpcServer(_GrpcAsyncServer):
         # TODO: more tests about gRPC server and task status ?
         return False if not isinstance(self._thread, threading.Thread) else self._thread.is_alive()
 
-    def _run_threadsafe(self, coroutine: Coroutine) -> Any:
+    def _run_threadsafe(self, coroutine: Coroutine, timeout: Optional[float] = None) -> Any:
         """Runs given coroutine threadsafe
 
         Args:
             coroutine: Awaitable function to be executed as threadsafe
+            timeout: maximum time in seconds to wait for the coroutine to complete. Defaults to the
+                call timeout of the server.
 
         Returns:
             Coroutine return value.
+
+        Raises:
+            FedbiomedCommunicationError: coroutine did not complete before timeout
         """
 
+        if timeout is None:
+            timeout = self._call_timeout
+
         future = asyncio.run_coroutine_threadsafe(
             coroutine, self._loop
         )
 
-
-        return future.result()
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError as e:
+            future.cancel()
+            raise FedbiomedCommunicationError(
+                f"{ErrorNumbers.FB628}: Communication server did not complete the operation "
+                f"in {timeout} seconds.") from e
@@ -6,22 +6,26 @@ from flask import Flask, send_from_directory
 from flask_jwt_extended import JWTManager
 
 
-from .utils import error
+from .utils import error, OrjsonProvider
 from .config import config
 
 # Import api route blueprint before importing routes and register as blueprint
 from .routes import api, auth
 
 
-build_dir = os.path.join(Path(__file__).parent, "..", "ui", "build")
+build_dir = str(Path(__file__).resolve().parent.parent / "ui" / "build")
 
-print(build_dir)
+# React build is not modified while the application runs: list its files once
+# instead of checking the file system on each request
+build_files = frozenset(
+    file.relative_to(build_dir).as_posix() for file in Path(build_dir).rglob('*') if file.is_file()
+)
 
 # Create Flask Application
 app = Flask(__name__, static_folder=build_dir)
+app.json = OrjsonProvider(app)
 
 # Configure Flask app
-db_prefix = os.getenv('DB_PREFIX', 'db_')
 app.config.update(config.configuration)
 
 
@@ -51,6 +55,9 @@ app.register_blueprint(auth)
 # Setup basepath for frontend
 base_path = os.environ.get("REACT_APP_BASE_PATH", '')
 root_path = base_path or '/'
+# React build assets under `static/` have content hashes in their names, so they never change
+STATIC_ASSETS_MAX_AGE = 31536000
+
 # Routes for react build directory
 @app.route(f'{root_path}', defaults={'path': ''}, methods=['GET'])
 @app.route(f'{base_path}/<path:path>')
@@ -59,10 +66,17 @@ def index(path):
         React build files. Which is located at the front-end folder.
     """
 
-    if path != "" and os.path.exists(os.path.join(app.static_folder, path)):
+    # Responses are conditional (ETag, Last-Modified) so browsers can revalidate with 304s.
+    if path in build_files:
+        if path.startswith('static/'):
+            # Hashed React build assets: let clients cache them for a long time
+            response = send_from_directory(app.static_folder, path, max_age=STATIC_ASSETS_MAX_AGE)
+            response.cache_control.immutable = True
+            return response
         return send_from_directory(app.static_folder, path)
-    else:
-        return send_from_directory(app.static_folder, 'index.html')
+
+    # Also served for unknown or outdated asset paths: it must never be cached
+    return send_from_directory(app.static_folder, 'index.html', max_age=0)
 
 
 @jwt.expired_token_loader
@@ -72,13 +86,12 @@ def expired_token_callback(jwt_header, jwt_payload):
     return err, 401
 
 
+HSTS_POLICY = 'max-age=100000; includeSubDomains'
+
+
 def hsts_header():
     """Returns the proper HSTS policy."""
-    hsts_age = 100_000
-    hsts_policy = 'max-age={0}'.format(hsts_age)
-    hsts_policy += '; includeSubDomains'
-
-    return hsts_policy
+    return HSTS_POLICY
 
 
 # Run the application
@@ -1,50 +1,87 @@
 import re
-from hashlib import sha512
+import threading
+import time
 from flask import request
 from functools import wraps
+from tinydb.table import Document
 from flask_jwt_extended import (jwt_required, create_access_token, create_refresh_token, unset_jwt_cookies,
                                 verify_jwt_in_request, get_jwt)
 
 from fedbiomed.common.constants import UserRoleType
 
 from ..db import user_database
-from ..utils import error, response
+from ..utils import error, response, set_password_hash, check_password_hash, password_hash_needs_update
 
 user_table = user_database.table('Users')
 query = user_database.query()
 
+MAIL_FORMAT_REGEX = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PASSWORD_FORMAT_REGEX = re.compile(r'^(?=.*?[A-Z])(?=.*?[a-z])(?=.*?[0-9]).{8,}$')
+
+# Number of seconds a user retrieved by email is kept in memory
+USER_CACHE_TTL = 30
+
+# Users retrieved by email: {user_email: (expiry_time, user)}, shared by the server threads
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+
+def _copy_user(user: Document) -> Document:
+    """ Copies a user, so that the one kept in memory is not modified through a reference to it"""
+    return Document(dict(user), doc_id=user.doc_id)
+
+
+def get_user_by_email(user_email: str) -> str:
+    """ Method used to retrieve a user from the database based on its email. Users found are
+    kept in memory for `USER_CACHE_TTL` seconds, or until `uncache_user` is called for them.
+    Each call returns its own copy of the user, that callers may modify.
+
+    The cache is per process and only refreshed by the routes that call `cache_user` or
+    `uncache_user`. Users modified in the database by other means (eg admin creation in `db.py`,
+    or another process) may be returned with their former role or password hash for up to
+    `USER_CACHE_TTL` seconds.
 
-def set_password_hash(password: str) -> str:
-    """ Method for setting password hash
     Args:
 
-        password (str): Password of the user
+        user_email (str): The mail of the user to retrieve from the database
     """
-    return sha512(password.encode('utf-8')).hexdigest()
+    with _user_cache_lock:
+        cached = _user_cache.get(user_email)
+        if cached is not None and cached[0] > time.monotonic():
+            return _copy_user(cached[1])
+
+    user = user_table.get(query.user_email == user_email)
+
+    # unknown emails are not cached, so that arbitrary lookups cannot grow the cache
+    if user:
+        cache_user(user)
 
+    return user
 
-def check_password_hash(password: str, user_password_hash: str) -> bool:
-    """ Method used to compare password hashes.
-        Used to verify the user password
+
+def cache_user(user: Document):
+    """ Method used to keep an up-to-date user in memory for `get_user_by_email`
     Args:
 
-        password (str): Password to compare against the user password hash
-        user_password_hash (str): User password hash
-    Returns:
-        True if the password hash matches the user password one
-        False otherwise
+        user (Document): The user, as stored in the database
     """
-    password_hash = sha512(password.encode('utf-8'))
-    return password_hash.hexdigest() == user_password_hash
+    now = time.monotonic()
+    with _user_cache_lock:
+        for email in [email for email, (expiry, _) in _user_cache.items() if expiry <= now]:
+            del _user_cache[email]
+        _user_cache[user['user_email']] = (now + USER_CACHE_TTL, _copy_user(user))
 
 
-def get_user_by_email(user_email: str) -> str:
-    """ Method used to retrieve a user from the database based on its email
+def uncache_user(user_id: str):
+    """ Method used to drop a user kept in memory by `get_user_by_email`, after it is modified
+    or removed in the database
     Args:
 
-        user_email (str): The mail of the user to retrieve from the database
+        user_id (str): The id of the user to drop
     """
-    return user_table.get(query.user_email == user_email)
+    with _user_cache_lock:
+        for email in [email for email, (_, user) in _user_cache.items() if user['user_id'] == user_id]:
+            del _user_cache[email]
 
 
 def check_mail_format(user_mail: str) -> bool:
@@ -53,8 +90,7 @@ def check_mail_format(user_mail: str) -> bool:
 
         user_mail (str): The mail to check
     """
-    regex = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.fullmatch(regex, user_mail)
+    return MAIL_FORMAT_REGEX.fullmatch(user_mail)
 
 
 def check_password_format(user_password: str) -> bool:
@@ -65,8 +101,7 @@ def check_password_format(user_password: str) -> bool:
         - at least 8 character long
         - with at least one uppercase letter, one lowercase letter and one number
     """
-    regex = r'^(?=.*?[A-Z])(?=.*?[a-z])(?=.*?[0-9]).{8,}$'
-    return re.fullmatch(regex, user_password)
+    return PASSWORD_FORMAT_REGEX.fullmatch(user_password)
 
 
 def admin_required(func):
@@ -1,8 +1,10 @@
 import re
+import secrets
 import uuid
 from datetime import datetime
-from hashlib import sha512
+from functools import lru_cache
 from flask import request
+from tinydb.table import Document
 from flask_jwt_extended import (
     jwt_required,
     create_access_token,
@@ -15,8 +17,11 @@ from fedbiomed.common.constants import UserRoleType, UserRequestStatus
 
 from ..helpers.auth_helpers import  (
     get_user_by_email,
+    cache_user,
+    uncache_user,
     set_password_hash,
-    check_password_hash
+    check_password_hash,
+    password_hash_needs_update
 )
 
 from ..utils import error, response
@@ -32,6 +37,16 @@ user_requests_table = user_database.table('Requests')
 query = user_database.query()
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash checked when logging in with an unknown email, so that it takes as long as with a known one
+    and response times do not reveal which accounts exist.
+
+    Computed on the first such login rather than at import, to keep one KDF run off worker startup.
+    """
+    return set_password_hash(secrets.token_hex(16))
+
+
 @api.route('/update-password', methods=['POST'])
 @validate_request_data(schema=ValidateUserFormRequest)
 @middleware(middlewares=[validate_password])
@@ -77,6 +92,7 @@ def update_password():
         user_table.update({
             "password_hash": set_password_hash(password)
         }, query.user_email == decoded_json['email'])
+        uncache_user(res['user_id'])
         res = user_table.get(query.user_email == email)
 
         return response({
@@ -190,6 +206,7 @@ def login():
 
     if not user:
         # user account not found
+        check_password_hash(password, _dummy_password_hash())
         return error(f'Unrecognized email address {email}. Please register before to log in'), 401
 
     # Should send back only one item
@@ -203,8 +220,13 @@ def login():
         access_token = create_access_token(identity=user["user_id"], fresh=True, additional_claims=additional_claims)
         refresh_token = create_refresh_token(identity=user["user_id"], additional_claims=additional_claims)
 
-        # Update last login
-        user_table.update({'last_login': datetime.now().isoformat()}, query.user_id == user['user_id'])
+        # Update last login, and password hash if it was created with an outdated scheme
+        user_update = {'last_login': datetime.now().isoformat()}
+        if password_hash_needs_update(user['password_hash']):
+            user_update['password_hash'] = set_password_hash(password)
+        user_table.update(user_update, query.user_id == user['user_id'])
+        # keep the logged-in user in memory, with its updated fields
+        cache_user(Document({**user, **user_update}, doc_id=user.doc_id))
 
         resp = response(
             data={
@@ -256,4 +278,3 @@ def logout():
 
 # TODO : Generate secret key server randomly
 # TODO : Implement method to retrieve user password
-# TODO : Add salt to encrypted passwords
@@ -18,7 +18,7 @@ from ..schemas import (
 )
 from ..middlewares.auth_validation import validate_email_register, validate_password
 from ..middlewares import middleware
-from ..helpers.auth_helpers import set_password_hash, admin_required
+from ..helpers.auth_helpers import set_password_hash, admin_required, uncache_user
 from ..utils import error, validate_request_data, response
 from .api import api
 
@@ -158,6 +158,7 @@ def remove_user():
 
     try:
         user_table.remove(where('user_id') == user_id)
+        uncache_user(user_id)
     except Exception as e:
         return error(str(e)), 400
 
@@ -212,6 +213,7 @@ def reset_user_password():
 
     try:
         res = user_table.update({"password_hash": password_hash}, query.user_id == user_id)
+        uncache_user(user_id)
     except Exception as e:
         return error(str(e)), 400
 
@@ -256,6 +258,7 @@ def change_user_role():
 
     try:
         res = user_table.update({"user_role": role}, query.user_id == user_id)
+        uncache_user(user_id)
     except Exception as e:
         return error(str(e)), 400
 
@@ -1,21 +1,131 @@
 import configparser
 import datetime
+import hmac
 import os
 from functools import wraps
-from hashlib import sha512
+from hashlib import scrypt, sha512
+from typing import Any
+
+import orjson
 from flask import jsonify, request
+from flask.json.provider import DefaultJSONProvider
 
 from .cache import RepositoryCache
 from .schemas import Validator
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider for Flask that encodes and decodes with orjson
+
+    Types not natively supported by orjson (and dates, to keep Flask's HTTP date format)
+    are encoded with the default Flask provider function.
+
+    Unlike the default Flask provider, which writes them as `NaN` and `Infinity`, NaN and
+    infinite floats (eg missing values in dataset previews) are encoded as `null`: the output
+    is always valid JSON, which the UI can parse.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """ Serializes given object to a JSON string
+
+        Args:
+            obj: object to serialize
+            **kwargs: only `indent` is used, other arguments are ignored
+        """
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """ Deserializes given JSON string
+
+        Args:
+            s: JSON string to deserialize
+            **kwargs: ignored
+        """
+        return orjson.loads(s)
+
+
+# Parameters of the scrypt key derivation function used for hashing passwords.
+# One hash uses 128 * N * R bytes (16 MiB) and takes about 50 ms of CPU. The GUI is served by a
+# single synchronous gunicorn worker, so every hash holds up all other GUI requests for that time:
+# one per login (against a dummy hash for unknown emails), plus one more the first time a user
+# with a legacy SHA-512 hash logs in, to rehash the password. Raise these with care.
+PASSWORD_HASH_SCHEME = 'scrypt'
+PASSWORD_HASH_SCRYPT_N = 2 ** 14
+PASSWORD_HASH_SCRYPT_R = 8
+PASSWORD_HASH_SCRYPT_P = 1
+PASSWORD_HASH_SALT_LENGTH = 16
+
+
+def _scrypt_password(password: str, salt: bytes, n: int, r: int, p: int) -> str:
+    """ Computes scrypt hash of a password
+
+    Returns:
+        Hexadecimal digest of the hash
+    """
+    return scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p).hex()
+
+
 def set_password_hash(password: str) -> str:
     """ Method for setting password hash
+
+    Password is hashed using scrypt with a random salt. The returned string
+    contains the hash scheme, its parameters and the salt.
+
     Args:
 
         password (str): Password of the user
     """
-    return sha512(password.encode('utf-8')).hexdigest()
+    salt = os.urandom(PASSWORD_HASH_SALT_LENGTH)
+    password_hash = _scrypt_password(
+        password, salt, PASSWORD_HASH_SCRYPT_N, PASSWORD_HASH_SCRYPT_R, PASSWORD_HASH_SCRYPT_P)
+
+    return f'{PASSWORD_HASH_SCHEME}${PASSWORD_HASH_SCRYPT_N}${PASSWORD_HASH_SCRYPT_R}' \
+           f'${PASSWORD_HASH_SCRYPT_P}${salt.hex()}${password_hash}'
+
+
+def check_password_hash(password: str, user_password_hash: str) -> bool:
+    """ Method used to compare password hashes.
+        Used to verify the user password
+
+    Hashes created before scrypt was introduced (unsalted SHA-512) are also supported.
+
+    Args:
+
+        password (str): Password to compare against the user password hash
+        user_password_hash (str): User password hash
+    Returns:
+        True if the password hash matches the user password one
+        False otherwise
+    """
+    if user_password_hash.startswith(f'{PASSWORD_HASH_SCHEME}$'):
+        try:
+            _, n, r, p, salt, expected_hash = user_password_hash.split('$')
+            password_hash = _scrypt_password(password, bytes.fromhex(salt), int(n), int(r), int(p))
+        except ValueError:
+            # malformed hash or invalid scrypt parameters
+            return False
+    else:
+        expected_hash = user_password_hash
+        password_hash = sha512(password.encode('utf-8')).hexdigest()
+
+    return hmac.compare_digest(password_hash, expected_hash)
+
+
+def password_hash_needs_update(user_password_hash: str) -> bool:
+    """ Checks whether a password hash was created with an outdated scheme or parameters
+
+    Args:
+
+        user_password_hash (str): User password hash
+    """
+    return not user_password_hash.startswith(
+        f'{PASSWORD_HASH_SCHEME}${PASSWORD_HASH_SCRYPT_N}${PASSWORD_HASH_SCRYPT_R}${PASSWORD_HASH_SCRYPT_P}$')
 
 
 def get_node_id(config_file: str):
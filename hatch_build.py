@@ -27,13 +27,13 @@ class CustomBuildHook(BuildHookInterface):
         if env.get("REACT_APP_BASE_PATH"):
             logger.info(f"Fedbiomed UI is running with basepath '{os.environ.get('REACT_APP_BASE_PATH')}'")
             env["PUBLIC_URL"] = env["REACT_APP_BASE_PATH"]
+        # source maps are not needed in the packaged front-end, skip generating them
+        env.setdefault("GENERATE_SOURCEMAP", "false")
 
-        os.chdir("fedbiomed_gui/ui")
-        try:
-            logger.info("### Yarn: Installation front-end dependencies to prepare build.\n")
-            subprocess.run([yarn, "install"], check=True)
-            logger.info("\n### Yarn: Building front-end application run.\n")
-            subprocess.run([yarn, "build"], check=True, env=env)
-        finally:
-            os.chdir("../../")
+        # run in the ui directory without changing the process working directory
+        ui_dir = os.path.join(self.root, "fedbiomed_gui", "ui")
 
+        logger.info("### Yarn: Installation front-end dependencies to prepare build.\n")
+        subprocess.run([yarn, "install", "--prefer-offline"], check=True, cwd=ui_dir)
+        logger.info("\n### Yarn: Building front-end application run.\n")
+        subprocess.run([yarn, "build"], check=True, env=env, cwd=ui_dir)
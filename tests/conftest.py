@@ -0,0 +1,34 @@
+"""
+Module for global PyTest configuration of unit tests
+
+"""
+
+import os
+import shutil
+import tempfile
+
+
+# Researcher component used by the tests is created in a temporary directory, removed at the
+# end of the session. When tests are distributed over several processes with pytest-xdist
+# (`pytest -n auto`), each worker gets its own component: workers would otherwise race while
+# creating the component directory when `fedbiomed.researcher` is imported.
+#
+# Workers inherit the environment of the controller process: a component root set by this
+# module in the controller (recorded in `_FBM_TESTS_COMPONENT_ROOT`) is replaced, while a root
+# chosen by the user is kept.
+_component_tmp_dir = None
+_component_root = os.environ.get("FBM_RESEARCHER_COMPONENT_ROOT")
+if _component_root is None or _component_root == os.environ.get("_FBM_TESTS_COMPONENT_ROOT"):
+    _xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+    _component_tmp_dir = tempfile.mkdtemp(
+        prefix=f"fbm-tests-{_xdist_worker}-" if _xdist_worker else "fbm-tests-"
+    )
+    _component_root = os.path.join(_component_tmp_dir, "fbm-researcher")
+    os.environ["FBM_RESEARCHER_COMPONENT_ROOT"] = _component_root
+    os.environ["_FBM_TESTS_COMPONENT_ROOT"] = _component_root
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Removes the temporary researcher component at the end of the test session"""
+    if _component_tmp_dir is not None:
+        shutil.rmtree(_component_tmp_dir, ignore_errors=True)
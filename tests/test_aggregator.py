@@ -11,13 +11,6 @@ class TestAggregator(unittest.TestCase):
 
     # before the tests
     def setUp(self):
-        self.weights = [
-            [1.0, -1.0],  # what happens ? should we code it/test it ?
-            [2.0],
-            [0.0, 1.0],
-            [1.0, 2.0, 3.0, 4.0],
-        ]
-
         self.aggregator = Aggregator()
 
     # after the tests
@@ -1,5 +1,6 @@
 import unittest
 import logging
+from importlib import import_module
 from unittest.mock import patch
 from fedbiomed.common.data import DataLoadingPlan, DataLoadingPlanMixin, MapperBlock
 from testsupport.testing_data_loading_block import LoadingBlockForTesting, LoadingBlockTypesForTesting, \
@@ -27,16 +28,14 @@ class TestDataLoadingBlock(unittest.TestCase):
         self.dlb2.deserialize(serialized)
         self.assertDictEqual(self.dlb1.data, self.dlb2.data)
 
-        exec(f"import {serialized['loading_block_module']}")
-        dlb3 = eval(f"{serialized['loading_block_module']}.{serialized['loading_block_class']}()")
+        dlb3 = getattr(import_module(serialized['loading_block_module']), serialized['loading_block_class'])()
         dlb3.deserialize(serialized)
         self.assertDictEqual(self.dlb1.data, dlb3.data)
 
         dlb4 = MapperBlock()
         dlb4.map = {'test': 1, 1: 'test'}
         serialized = dlb4.serialize()
-        exec(f"import {serialized['loading_block_module']}")
-        dlb5 = eval(f"{serialized['loading_block_module']}.{serialized['loading_block_class']}()")
+        dlb5 = getattr(import_module(serialized['loading_block_module']), serialized['loading_block_class'])()
         dlb5.deserialize(serialized)
         self.assertEqual(dlb4.get_serialization_id(), dlb5.get_serialization_id())
         self.assertDictEqual(dlb4.map, dlb5.map)
@@ -267,6 +266,21 @@ class TestDataLoadingPlan(unittest.TestCase):
         tp.clear_dlp()
         self.assertEqual(tp.test_mapper(), 'orig-key')
 
+    def test_data_loading_plan_05_deserialize_caches_class_resolution(self):
+        """Tests that loading block classes and keys are resolved once across deserializations"""
+        dlb = MapperBlock()
+        dlb.map = {'orig-key': 'new-key'}
+        dlp = DataLoadingPlan()
+        dlp[LoadingBlockTypesForTesting.TESTING_MAPPER] = dlb
+        serialized = dlp.serialize()
+
+        DataLoadingPlan().deserialize(*serialized)
+        with patch('fedbiomed.common.data._data_loading_plan.import_module') as patched_import:
+            dlp2 = DataLoadingPlan().deserialize(*serialized)
+            patched_import.assert_not_called()
+        self.assertIsInstance(dlp2[LoadingBlockTypesForTesting.TESTING_MAPPER], MapperBlock)
+        self.assertDictEqual(dlp2[LoadingBlockTypesForTesting.TESTING_MAPPER].map, dlb.map)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,7 @@ import numpy as np
 
 
 from fedbiomed.researcher.aggregators.fedavg import FedAverage
+from fedbiomed.researcher.aggregators.functional import federated_averaging
 
 
 
@@ -118,6 +119,16 @@ class TestFedaverage(unittest.TestCase):
             self.aggregator.aggregate(model_params=model_params,
                                       weights=weights)
 
+    def test_fed_average_07_federated_averaging_normalizes_weights(self):
+        """Tests that weights not summing up to 1 are normalized into proportions"""
+        model_params = [{'coef_': np.array([float(i)])} for i in range(100)]
+        weights = [float(i + 1) for i in range(100)]
+
+        agg_params = federated_averaging(model_params, weights)
+
+        proportions = np.array(weights) / np.sum(weights)
+        self.assertAlmostEqual(agg_params['coef_'][0], float(np.dot(proportions, np.arange(100))), places=10)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
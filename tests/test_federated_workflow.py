@@ -1,31 +1,71 @@
+import copy
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, Mock, mock_open, patch
 
 from testsupport.base_mocks import MockRequestModule
 from testsupport.fake_researcher_secagg import FakeSecAgg
 
-import fedbiomed
 from fedbiomed.common.constants import __breakpoints_version__, SecureAggregationSchemes
 from fedbiomed.common.exceptions import FedbiomedSecureAggregationError
 from fedbiomed.researcher.datasets import FederatedDataSet
 from fedbiomed.researcher.federated_workflows import FederatedWorkflow
+from fedbiomed.researcher.node_state_agent import NodeStateAgent
 from fedbiomed.researcher.secagg import SecureAggregation
 
 
+FAKE_SEARCH_REPLY = {'node1': [{'my-metadata': 'is-the-best', 'tags': ['some-tags']}]}
+BKPT_PATHS = ('/bkpt-path', 'bkpt-folder')
+BKPT_PAYLOAD = {
+    'id': 'exp-id',
+    'breakpoint_version': str(__breakpoints_version__),
+    'training_data': {'node1': [{'training': 'data', 'tags': 'some-tags'}]},
+    'experimentation_folder': 'some-folder',
+    'tags': ['some-tags'],
+    'nodes': ['node1'],
+    'secagg': {'class': 'SecureAggregation', 'module': 'fedbiomed.researcher.secagg._secure_aggregation', 'arguments': {'scheme': 2}, 'attributes': {}, 'attributes_states': {'_SecureAggregation__secagg': {'class': 'LomSecureAggregation', 'module': 'fedbiomed.researcher.secagg._secure_aggregation', 'arguments': {'active': False, 'clipping_range': None}, 'attributes': {'_experiment_id': None, '_parties': None, '_dh': None}}}},
+    'node_state': {'node_state': 'bkpt'},
+    'downstream': 'bkpt'
+}
+
+
+def _make_bkpt_payload(**overrides):
+    """Builds the content of a breakpoint file, with `overrides` replacing entries of `BKPT_PAYLOAD`
+
+    A copy is returned as loading the breakpoint converts its training data in place.
+    """
+    return {**copy.deepcopy(BKPT_PAYLOAD), **overrides}
+
+
 class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # same patch for all tests: install it once for the class
+        cls.abstract_methods_patcher = patch.multiple(FederatedWorkflow, __abstractmethods__=set())
+        cls.abstract_methods_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.abstract_methods_patcher.stop()
+        super().tearDownClass()
+
     def setUp(self):
         MockRequestModule.setUp(self, module="fedbiomed.researcher.federated_workflows._federated_workflow.Requests")
+        # `unittest.TestCase.tearDown` comes first in the MRO and does not chain to the mixin
+        self.addCleanup(MockRequestModule.tearDown, self)
         super().setUp()
-        self.abstract_methods_patcher = patch.multiple(FederatedWorkflow, __abstractmethods__=set())
-        self.abstract_methods_patcher.start()
 
-    def tearDown(self):
-        super().tearDown()
-        self.abstract_methods_patcher.stop()
+    def _mock_search_reply(self, reply=FAKE_SEARCH_REPLY):
+        """Makes the mocked `Requests.search` return a copy of `reply`, also kept in `self.fake_search_reply`
+
+        A copy is used as `FederatedDataSet` converts the reply in place.
+        """
+        self.fake_search_reply = copy.deepcopy(reply)
+        self.mock_requests.return_value.search.return_value = self.fake_search_reply
 
-    def test_federated_workflow_01_initialization(self):
-        """Test initialization of federated workflow, only cases where correct parameters are provided"""
+    def test_federated_workflow_01_initialization_defaults(self):
+        """Test default initialization of federated workflow"""
         # FederatedWorkflow must be default-constructible
         exp = FederatedWorkflow()
         self.assertIsNone(exp.tags())  # by default, tags set to None
@@ -33,36 +73,32 @@ class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
         self.assertIsNone(exp.training_data())  # by default, training data is initialized to something
         self.assertIsNotNone(exp.experimentation_folder())  # by default, exp folder is initialized to something
         # SecAgg
-        self.assertTrue(isinstance(exp.secagg, SecureAggregation))  # set to inactive SecureAggregation
+        self.assertIsInstance(exp.secagg, SecureAggregation)  # set to inactive SecureAggregation
         self.assertFalse(exp.secagg.active)
 
-        # Test all possible combinations of init arguments
-        _training_data = MagicMock(spec=fedbiomed.researcher.datasets.FederatedDataSet)
-        _secagg = MagicMock(spec=fedbiomed.researcher.secagg.SecureAggregation)
+    def test_federated_workflow_01_initialization_arguments(self):
+        """Test initialization of federated workflow with combinations of correct parameters"""
+        _training_data = FederatedDataSet({'one-node': {'tags': ['one-tag']}})
+        _secagg = Mock(spec_set=SecureAggregation)
         parameters_and_possible_values = {
             'tags': (None, None, ['one-tag', 'another-tag']),
             'nodes': (['one-node'], None, None),
             'training_data': (_training_data, {'one-node': {'tags': ['one-tag']}}, None),
             'experimentation_folder': ('folder_name', None, None),
-             'secagg': (True, False, _secagg),
+            'secagg': (True, False, _secagg),
             'save_breakpoints': (True, False, True)
         }
-        # Compute cartesian product of parameter values to obtain all possible combinations
-
         combs = [{key: value[i]
-                    for key, value in parameters_and_possible_values.items() }
-                    for i in range(3)]
+                  for key, value in parameters_and_possible_values.items()}
+                 for i in range(3)]
 
         for params in combs:
-            try:
-                exp = FederatedWorkflow(**params)
-            except Exception as e:
-                print(f'Exception {e} raised with the following parameters {params}')
-                raise e
-
-        # Special corner cases that deserve additional testing
-        # Test case where tags are None but we are setting training data
-        _training_data.node_ids.return_value = ['alice', 'bob']  # make sure that nodes can be correctly inferred
+            with self.subTest(params=params):
+                FederatedWorkflow(**params)
+
+    def test_federated_workflow_01_initialization_nodes_without_tags(self):
+        """Test case where tags are None but we are setting nodes and training data"""
+        _training_data = FederatedDataSet({'alice': {}, 'bob': {}})  # make sure that nodes can be correctly inferred
         exp = FederatedWorkflow(
             nodes=['alice', 'bob'],
             training_data=_training_data,
@@ -71,28 +107,29 @@ class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
         )
         self.assertListEqual(exp.nodes(), ['alice', 'bob'])
         self.assertEqual(exp.training_data(), _training_data)
-        self.assertTrue(isinstance(exp.secagg, SecureAggregation))
+        self.assertIsInstance(exp.secagg, SecureAggregation)
         self.assertTrue(exp.secagg.active)
         self.assertTrue(exp.save_breakpoints())
-        # Test special cases regarding training data:
-        # a. when tags are provided but training data is not provided, build training data from tags
-        self.fake_search_reply = {'node1': [{'my-metadata': 'is-the-best', 'tags': ['some-tags']}]}
-        self.mock_requests.return_value.search.return_value = self.fake_search_reply
+
+    def test_federated_workflow_01_initialization_training_data_from_tags(self):
+        """Test that training data is built from tags when tags are provided without training data"""
+        self._mock_search_reply()
         exp = FederatedWorkflow(
             tags='some-tags'
         )
         self.assertListEqual(exp.tags(), ['some-tags'])
         self.assertDictEqual(exp.training_data().data(), self.fake_search_reply)
 
-        # b. when tags, nodes and training data are provided, the latter takes precedence and tags are set to None
+    def test_federated_workflow_01_initialization_tags_nodes_and_training_data(self):
+        """Test that providing tags, nodes and training data altogether is refused"""
+        _training_data = FederatedDataSet({'alice': {}, 'bob': {}})
         with self.assertRaises(SystemExit):
-            exp = FederatedWorkflow(
+            FederatedWorkflow(
                 tags='some-tags',
                 nodes=['wrong', 'nodes'],
                 training_data=_training_data
             )
 
-
     def test_federated_workflow_02_set_tags(self):
         exp = FederatedWorkflow()
 
@@ -151,13 +188,12 @@ class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
 
         self.assertIsNone(exp.training_data())
 
-        self.fake_search_reply = {'node1': [{'my-metadata': 'is-the-best', 'tags': ['some-tag']}]}
-        self.mock_requests.return_value.search.return_value = self.fake_search_reply
+        self._mock_search_reply()
         exp.set_tags('just-a-str')
         exp.set_training_data(None, from_tags=True)
         self.assertDictEqual(exp.training_data().data(),
-                             {'node1': {'my-metadata': 'is-the-best', 'tags': ['some-tag']}})
-        _training_data = MagicMock(spec=fedbiomed.researcher.datasets.FederatedDataSet)
+                             {'node1': {'my-metadata': 'is-the-best', 'tags': ['some-tags']}})
+        _training_data = FederatedDataSet({'node2': {'tags': ['other-tag']}})
         exp.set_training_data(_training_data)
         self.assertEqual(exp.training_data(), _training_data)
 
@@ -186,9 +222,9 @@ class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
     def test_federated_workflow_07_set_secagg(self):
         exp = FederatedWorkflow()
         exp.set_secagg(True)
-        self.assertTrue(isinstance(exp.secagg, SecureAggregation))
+        self.assertIsInstance(exp.secagg, SecureAggregation)
         self.assertTrue(exp.secagg.active)
-        _secagg = MagicMock(spec=fedbiomed.researcher.secagg.SecureAggregation)
+        _secagg = Mock(spec_set=SecureAggregation)
         exp.set_secagg(_secagg)
         self.assertEqual(exp.secagg, _secagg)
 
@@ -200,33 +236,40 @@ class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
             with self.assertRaises(SystemExit):
                 exp.set_secagg(True, scheme)
 
-    def test_federated_workflow_08_consistency_fds_tags(self):
-
-        self.fake_search_reply = {'node1': [{'my-metadata': 'is-the-best', 'tags': ['some-tags']}]}
-        self.mock_requests.return_value.search.return_value = self.fake_search_reply
+    def test_federated_workflow_08_consistency_set_tags_without_training_data(self):
+        """Setting tags when training data is None simply sets tags and training data from them"""
+        self._mock_search_reply()
         exp = FederatedWorkflow()
-        # setting tags when training data is None -> simply set tags
         exp.set_tags(['some-tags'])
         self.assertListEqual(exp.tags(), ['some-tags'])
         self.assertDictEqual(exp.training_data().data(), self.fake_search_reply)
         self.assertIsNone(exp.nodes())  # no filtering applied
 
-
-        # resetting tags to None when training data is not None -> simply set tags to None
+    def test_federated_workflow_08_consistency_set_training_data_without_tags(self):
+        """Setting training data when tags are None keeps tags to None"""
+        self._mock_search_reply()
+        exp = FederatedWorkflow()
+        exp.set_tags(['some-tags'])
         exp._tags = None
         exp.set_training_data(FederatedDataSet(self.fake_search_reply))
         self.assertIsNone(exp.tags())
         self.assertDictEqual(exp.training_data().data(), self.fake_search_reply)
 
-        # setting training data from tags, when tags is None -> raise error
+    def test_federated_workflow_08_consistency_training_data_from_missing_tags(self):
+        """Setting training data from tags when tags are None raises an error"""
+        self._mock_search_reply()
+        exp = FederatedWorkflow()
+        exp.set_training_data(FederatedDataSet(self.fake_search_reply))
         with self.assertRaises(SystemExit):
             exp.set_training_data(None, from_tags=True)
 
-        # set tags when training data is not None -> reset training data based on new tags
+    def test_federated_workflow_08_consistency_set_tags_with_training_data(self):
+        """Setting tags when training data is not None resets training data based on new tags"""
+        self._mock_search_reply()
+        exp = FederatedWorkflow()
         exp.set_training_data(FederatedDataSet(self.fake_search_reply))
-        self.fake_search_reply = {'node2': [{'my-metadata': 'is-the-bestest', 'tags': ['other-tags']}]}
         self.mock_requests.reset_mock()
-        self.mock_requests.return_value.search.return_value = self.fake_search_reply
+        self._mock_search_reply({'node2': [{'my-metadata': 'is-the-bestest', 'tags': ['other-tags']}]})
         exp.set_tags('other-tags')
         self.assertListEqual(exp.tags(), ['other-tags'])
         self.assertDictEqual(exp.training_data().data(), self.fake_search_reply)
@@ -315,18 +358,17 @@ class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
             self.assertEqual(_secagg.setup.call_count, 0)
             self.assertDictEqual(secagg_args, {})
 
-    @patch('fedbiomed.researcher.federated_workflows._federated_workflow.open')
     @patch('fedbiomed.researcher.federated_workflows._federated_workflow.json.dump')
+    @patch('fedbiomed.researcher.federated_workflows._federated_workflow.open', new_callable=mock_open)
     @patch('fedbiomed.researcher.federated_workflows._federated_workflow.choose_bkpt_file',
-           return_value=('/bkpt-path', 'bkpt-folder'))
+           return_value=BKPT_PATHS)
     def test_federated_workflow_10_breakpoint(self,
                                               mock_bkpt_file,
-                                              mock_json_dump,
-                                              mock_open
+                                              mock_open_file,
+                                              mock_json_dump
                                               ):
         # define attributes that will be saved in breakpoint
-        _training_data = MagicMock(spec=fedbiomed.researcher.datasets.FederatedDataSet)
-        _training_data.data.return_value = {'training': 'data'}
+        _training_data = FederatedDataSet({'node1': {'training': 'data'}})
         exp = FederatedWorkflow(
             training_data=_training_data,
         )
@@ -337,55 +379,45 @@ class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
             {
                 'id': exp.id,
                 'breakpoint_version': str(__breakpoints_version__),
-                'training_data': {'training': 'data'},
+                'training_data': {'node1': {'training': 'data'}},
                 'experimentation_folder': exp.experimentation_folder(),
                 'tags': exp.tags(),
                 'nodes': exp.nodes(),
                 'secagg': exp.secagg.save_state_breakpoint(),
                 'node_state': exp._node_state_agent.save_state_breakpoint()
             },
-            mock_open.return_value.__enter__.return_value
+            mock_open_file.return_value
         )
 
-        mock_open.side_effect = OSError
+        mock_open_file.side_effect = OSError
 
         with self.assertRaises(SystemExit):
             exp.breakpoint(state={}, bkpt_number=1)
 
 
 
-    @patch('fedbiomed.researcher.federated_workflows._federated_workflow.open')
     @patch('fedbiomed.researcher.federated_workflows._federated_workflow.json.load')
-    @patch('fedbiomed.researcher.federated_workflows._federated_workflow.find_breakpoint_path',
-           return_value=('/bkpt-path', 'bkpt-folder'))
+    @patch.multiple('fedbiomed.researcher.federated_workflows._federated_workflow',
+                    open=DEFAULT, find_breakpoint_path=DEFAULT)
     @patch('fedbiomed.researcher.federated_workflows._federated_workflow.JoyeLibertSecureAggregation.load_state_breakpoint')
     @patch('fedbiomed.researcher.federated_workflows._federated_workflow.NodeStateAgent.load_state_breakpoint')
     def test_federated_workflow_05_load_breakpoint(self,
                                                    mock_node_state_load,
                                                    mock_secagg_load,
-                                                   mock_bkpt_file,
                                                    mock_json_load,
-                                                   mock_open
+                                                   **mocks
                                                    ):
+        mock_open = mocks['open']
+        mocks['find_breakpoint_path'].return_value = BKPT_PATHS
 
         # Invalid argument should be string or None
         with self.assertRaises(SystemExit):
            exp, _ = FederatedWorkflow.load_breakpoint(breakpoint_folder_path=15)
 
         # Normal test case
-        mock_secagg_load.return_value = MagicMock(spec=SecureAggregation)
-        mock_node_state_load.return_value = MagicMock(spec=fedbiomed.researcher.node_state_agent.NodeStateAgent)
-        mock_json_load.return_value = {
-                'id': 'exp-id',
-                'breakpoint_version': str(__breakpoints_version__),
-                'training_data': {'node1': [{'training': 'data', 'tags': 'some-tags'}]},
-                'experimentation_folder': 'some-folder',
-                'tags': ['some-tags'],
-                'nodes': ['node1'],
-                'secagg': {'class': 'SecureAggregation', 'module': 'fedbiomed.researcher.secagg._secure_aggregation', 'arguments': {'scheme': 2}, 'attributes': {}, 'attributes_states': {'_SecureAggregation__secagg': {'class': 'LomSecureAggregation', 'module': 'fedbiomed.researcher.secagg._secure_aggregation', 'arguments': {'active': False, 'clipping_range': None}, 'attributes': {'_experiment_id': None, '_parties': None, '_dh': None}}}},
-                'node_state': {'node_state': 'bkpt'},
-                'downstream': 'bkpt'
-            }
+        mock_secagg_load.return_value = Mock(spec_set=SecureAggregation)
+        mock_node_state_load.return_value = Mock(spec_set=NodeStateAgent)
+        mock_json_load.return_value = _make_bkpt_payload()
 
         exp, saved_state = FederatedWorkflow.load_breakpoint()
 
@@ -419,6 +451,33 @@ class TestFederatedWorkflow(unittest.TestCase, MockRequestModule):
 
 
 
+    @patch('fedbiomed.researcher.federated_workflows._federated_workflow.json.load')
+    @patch.multiple('fedbiomed.researcher.federated_workflows._federated_workflow',
+                    open=DEFAULT, find_breakpoint_path=DEFAULT)
+    @patch('fedbiomed.researcher.federated_workflows._federated_workflow.NodeStateAgent.load_state_breakpoint')
+    def test_federated_workflow_05_load_breakpoint_content_variants(self,
+                                                                    mock_node_state_load,
+                                                                    mock_json_load,
+                                                                    **mocks
+                                                                    ):
+        """Tests loading breakpoints whose content differs from the default one"""
+        mocks['find_breakpoint_path'].return_value = BKPT_PATHS
+        mock_node_state_load.return_value = Mock(spec_set=NodeStateAgent)
+
+        # no tags and no nodes filter were saved
+        mock_json_load.return_value = _make_bkpt_payload(tags=None, nodes=None)
+        exp, saved_state = FederatedWorkflow.load_breakpoint()
+        self.assertIsNone(exp.tags())
+        self.assertIsNone(exp.nodes())
+        self.assertEqual(exp.training_data().data(), {'node1': {'training': 'data', 'tags': 'some-tags'}})
+
+        # breakpoint was saved with an incompatible format version
+        for version in ['1', '99']:
+            with self.subTest(breakpoint_version=version):
+                mock_json_load.return_value = _make_bkpt_payload(breakpoint_version=version)
+                with self.assertRaises(SystemExit):
+                    FederatedWorkflow.load_breakpoint()
+
     def test_federated_workflow_06_all_federation_nodes(self):
         """Tests retrieving nodes"""
 
@@ -42,16 +42,40 @@ from fedbiomed.common.optimizers.optimizer import Optimizer as FedOptimizer
 from fedbiomed.common.models import SkLearnModel, Model, TorchModel, BaseSkLearnModel
 
 
+def _flatten_torch_weights(weights: Dict[str, torch.Tensor]) -> torch.Tensor:
+    """Concatenates all layers of a torch weights/gradients dict into a single flat tensor"""
+    tensors = [val.reshape(-1) for val in weights.values()]
+    # gradients dict is empty when no backward pass has populated them
+    return torch.cat(tensors) if tensors else torch.empty(0)
+
+
+def _flatten_numpy_weights(weights: Dict[str, np.ndarray]) -> np.ndarray:
+    """Concatenates all layers of a sklearn weights dict into a single flat array"""
+    return np.concatenate([np.ravel(val) for val in weights.values()])
+
+
+def _random_subset(rng: random.Random, items: List[Any], min_size: int = 0) -> List[Any]:
+    """Draws a random subset of `items`, of random size between `min_size` and `len(items)`"""
+    return rng.sample(items, rng.randint(min_size, len(items)))
+
+
 class TestDeclearnOptimizer(unittest.TestCase):
 
-    def setUp(self) -> None:
-        self._optim_wrapper = DeclearnOptimizer
+    @classmethod
+    def setUpClass(cls) -> None:
+        # models shared by all tests: each test works on its own copies
+        cls._optim_wrapper = DeclearnOptimizer
 
-        self._torch_model = nn.Linear(4,2)
-        self._zero_model = copy.deepcopy(self._torch_model)
+        cls._base_torch_model = nn.Linear(4,2)
+        cls._base_zero_model = copy.deepcopy(cls._base_torch_model)
         # setting all coefficients of `zero_model` to 0
-        for p in self._zero_model.parameters():
-            p.data.fill_(0)
+        with torch.no_grad():
+            for p in cls._base_zero_model.parameters():
+                p.zero_()
+
+    def setUp(self) -> None:
+        self._torch_model = copy.deepcopy(self._base_torch_model)
+        self._zero_model = copy.deepcopy(self._base_zero_model)
         self._sklearn_model_wrappers = (SkLearnModel(SGDClassifier),
                                         SkLearnModel(SGDRegressor))
 
@@ -59,6 +83,7 @@ class TestDeclearnOptimizer(unittest.TestCase):
         self._torch_model_wrappers = (TorchModel(self._torch_model),)
         self._torch_zero_model_wrappers = (TorchModel(self._zero_model),)
 
+        # declearn modules keep optimizer states updated by `step`: build fresh ones for each test
         self.modules = [
             ScaffoldServerModule(),
             YogiMomentumModule(),
@@ -67,6 +92,12 @@ class TestDeclearnOptimizer(unittest.TestCase):
             YogiModule()
             ]
         self.regularizers = [FedProxRegularizer(), LassoRegularizer(), RidgeRegularizer()]
+        # expected `(name, config)` entries of an optimizer state, for each module / regularizer
+        self._module_configs = {id(mod): (mod.name, mod.get_config()) for mod in self.modules}
+        self._reg_configs = {id(reg): (reg.name, reg.get_config()) for reg in self.regularizers}
+
+        # random draws of `create_random_declearn_optimizer`, seeded so that test runs are reproducible
+        self._rng = random.Random(0)
 
     def tearDown(self) -> None:
         return super().tearDown()
@@ -93,13 +124,13 @@ class TestDeclearnOptimizer(unittest.TestCase):
             - the list of randomized Regularizers
         """
         min_modules = 0 if not forces_mod_and_reg else 1
-        selected_modules = random.sample(self.modules, random.randint(min_modules, len(self.modules)))
-        selected_reg = random.sample(self.regularizers, random.randint(min_modules, len(self.regularizers)))
+        selected_modules = _random_subset(self._rng, self.modules, min_modules)
+        selected_reg = _random_subset(self._rng, self.regularizers, min_modules)
 
         optim = FedOptimizer(lr=learning_rate,
-                                decay=w_decay,
-                                modules=selected_modules,
-                                regularizers=selected_reg)
+                             decay=w_decay,
+                             modules=selected_modules,
+                             regularizers=selected_reg)
         return optim, selected_modules, selected_reg
 
     def check_optimizer_states(self,
@@ -174,10 +205,13 @@ class TestDeclearnOptimizer(unittest.TestCase):
 
         optim = FedOptimizer(lr=1.)
 
+        # snapshot weights before the step (`torch.cat` copies them), so models can be updated in place
+        initial_weights = [_flatten_torch_weights(model.get_weights()) for model in self._torch_zero_model_wrappers]
+
         # initilise optimizer wrappers
-        initialized_torch_optim_wrappers = (
-            DeclearnOptimizer(copy.deepcopy(model), optim) for model in self._torch_zero_model_wrappers
-            )
+        initialized_torch_optim_wrappers = [
+            DeclearnOptimizer(model, optim) for model in self._torch_zero_model_wrappers
+        ]
 
         fake_retrieved_grads = [
             {name: param for (name, param) in model.model.state_dict().items() }
@@ -186,18 +220,17 @@ class TestDeclearnOptimizer(unittest.TestCase):
 
         fake_retrieved_grads = [TorchVector(grads) + 1 for grads in fake_retrieved_grads]
         # operation: do a SGD step with all gradients equal 1 and learning rate equals 1
-        for torch_optim_wrapper, zero_model, grads in zip(initialized_torch_optim_wrappers,
-                                                          self._torch_zero_model_wrappers,
-                                                          fake_retrieved_grads):
+        for torch_optim_wrapper, zero_weights, grads in zip(initialized_torch_optim_wrappers,
+                                                            initial_weights,
+                                                            fake_retrieved_grads):
             with patch.object(TorchModel, 'get_gradients') as get_gradients_patch:
                 get_gradients_patch.return_value = grads.coefs
 
                 torch_optim_wrapper.step()
                 get_gradients_patch.assert_called_once()
 
-            for (l, val), (l_ref, val_ref) in zip(zero_model.get_weights().items(), torch_optim_wrapper._model.get_weights().items()):
-
-                self.assertTrue(torch.isclose(val - 1, val_ref).all())
+            self.assertTrue(torch.allclose(zero_weights - 1,
+                                           _flatten_torch_weights(torch_optim_wrapper._model.get_weights())))
 
 
     def test_declearnoptimizer_03_step_method_2_SklearnOptimizer(self):
@@ -209,7 +242,7 @@ class TestDeclearnOptimizer(unittest.TestCase):
         for model in self._sklearn_model_wrappers:
             model.set_init_params({'n_features': num_features, 'n_classes': num_classes})
             model.model.eta0 = .1  # set learning rate to make sure it is different from 0
-        initialized_sklearn_optim = (DeclearnOptimizer(copy.deepcopy(model), optim) for model in self._sklearn_model_wrappers)
+        initialized_sklearn_optim = [DeclearnOptimizer(copy.deepcopy(model), optim) for model in self._sklearn_model_wrappers]
 
         fake_retrieved_grads = [
             copy.deepcopy(model.get_weights()) for model in self._sklearn_model_wrappers
@@ -224,9 +257,9 @@ class TestDeclearnOptimizer(unittest.TestCase):
                 sklearn_optim_wrapper.step()
                 get_gradients_patch.assert_called()
 
-            for (l, val), (l_ref, val_ref) in zip(zero_model.get_weights().items(),
-                                                  sklearn_optim_wrapper._model.get_weights().items()):
-                self.assertTrue(np.all(val - 1 == val_ref))  # NOTA: all val values are equal 0
+            # NOTA: all `zero_model` values are equal 0
+            self.assertTrue(np.allclose(_flatten_numpy_weights(zero_model.get_weights()) - 1,
+                                        _flatten_numpy_weights(sklearn_optim_wrapper._model.get_weights())))
 
     def test_declearnoptimizer_05_aux_variables(self):
         learning_rate = .12345
@@ -268,8 +301,8 @@ class TestDeclearnOptimizer(unittest.TestCase):
         def check_state(state: Dict[str, Any], learning_rate: float, w_decay: float, modules: List, regs: List, model):
             self.assertEqual(state['config']['lrate'], learning_rate)
             self.assertEqual(state['config']['w_decay'], w_decay)
-            self.assertListEqual(state['config']['regularizers'], [(reg.name, reg.get_config()) for reg in regs])
-            self.assertListEqual(state['config']['modules'], [(mod.name , mod.get_config()) for mod in modules])
+            self.assertListEqual(state['config']['regularizers'], [self._reg_configs[id(reg)] for reg in regs])
+            self.assertListEqual(state['config']['modules'], [self._module_configs[id(mod)] for mod in modules])
             new_optim = FedOptimizer.load_state(state)
             new_optim_wrapper = DeclearnOptimizer(model, new_optim).load_state(state)
             self.assertDictEqual(new_optim_wrapper.save_state(), state)
@@ -278,9 +311,12 @@ class TestDeclearnOptimizer(unittest.TestCase):
         learning_rate = .12345
         w_decay = .54321
 
-        for model_wrappers in (self._torch_model_wrappers, self._sklearn_model_wrappers):
-            for model in model_wrappers:
-                optim = FedOptimizer(lr=learning_rate, decay=w_decay)
+        models = (*self._torch_model_wrappers, *self._sklearn_model_wrappers)
+
+        # optimizers do not depend on the model: build each of them once and wrap it for every model
+        optim = FedOptimizer(lr=learning_rate, decay=w_decay)
+        for model in models:
+            with self.subTest(model=type(model.model).__name__):
                 optim_wrapper = DeclearnOptimizer(model, optim)
                 state = optim_wrapper.save_state()
 
@@ -288,11 +324,11 @@ class TestDeclearnOptimizer(unittest.TestCase):
 
         nb_tests = 10  # number of time the following test will be executed
 
-        for model_wrappers in (self._torch_model_wrappers, self._sklearn_model_wrappers):
-            for model in model_wrappers:
-                for _ in range(nb_tests):
-                    # test DeclearnOptimizer with random modules and regularizers
-                    optim, selected_modules, selected_reg = self.create_random_declearn_optimizer(learning_rate, w_decay)
+        for i in range(nb_tests):
+            # test DeclearnOptimizer with random modules and regularizers
+            optim, selected_modules, selected_reg = self.create_random_declearn_optimizer(learning_rate, w_decay)
+            for model in models:
+                with self.subTest(draw=i, model=type(model.model).__name__):
                     optim_wrapper = DeclearnOptimizer(model, optim)
                     state = optim_wrapper.save_state()
 
@@ -574,11 +610,12 @@ class TestTorchBasedOptimizer(unittest.TestCase):
     def setUp(self):
 
         self._torch_model = (nn.Linear(4, 2),)
-        self._fed_models = (TorchModel(model) for model in self._torch_model)
+        self._fed_models = [TorchModel(model) for model in self._torch_model]
         self._zero_models = [copy.deepcopy(model) for model in self._torch_model]
-        for model in self._zero_models:
-            for p in model.parameters():
-                p.data.fill_(0)
+        with torch.no_grad():
+            for model in self._zero_models:
+                for p in model.parameters():
+                    p.zero_()
 
     def tearDown(self) -> None:
         return super().tearDown()
@@ -591,16 +628,15 @@ class TestTorchBasedOptimizer(unittest.TestCase):
             # first check that element of model are non zeros
             grads = model.get_gradients()
             for l, val in grads.items():
-                self.assertFalse(torch.isclose(val, torch.zeros(val.shape)).all())
+                self.assertFalse((val == 0).all())
             # initialisation of declearn optimizer wrapper
             dec_model = copy.deepcopy(model)
             declearn_optim_wrapper = DeclearnOptimizer(dec_model, declearn_optim)
 
             declearn_optim_wrapper.zero_grad()
-            grads = dec_model.get_gradients()
+            grads = _flatten_torch_weights(dec_model.get_gradients())
 
-            for l, val in grads.items():
-                self.assertTrue(torch.isclose(val, torch.zeros(val.shape)).all())
+            self.assertTrue((grads == 0).all())
 
             # initialisation of native torch optimizer wrapper
             torch_model = copy.deepcopy(model)
@@ -608,9 +644,8 @@ class TestTorchBasedOptimizer(unittest.TestCase):
             native_torch_optim_wrapper = NativeTorchOptimizer(torch_model, torch_optim)
             native_torch_optim_wrapper.zero_grad()
 
-            grads = torch_model.get_gradients()
-            for l, val in grads.items():
-                self.assertTrue(torch.isclose(val, torch.zeros(val.shape)).all())
+            grads = _flatten_torch_weights(torch_model.get_gradients())
+            self.assertTrue((grads == 0).all())
 
     def test_torchbasedoptimizer_02_step(self):
         # check that declearn and torch plain SGD optimization step give the same result
@@ -650,9 +685,8 @@ class TestTorchBasedOptimizer(unittest.TestCase):
             native_torch_optim_wrapper.step()
 
             # checks
-            for (l, dec_optim_val), (l, torch_optim_val) in zip(declearn_optim_wrapper._model.get_weights().items(),
-                                                                 native_torch_optim_wrapper._model.get_weights().items()):
-                self.assertTrue(torch.isclose(dec_optim_val, torch_optim_val).all())
+            self.assertTrue(torch.allclose(_flatten_torch_weights(declearn_optim_wrapper._model.get_weights()),
+                                           _flatten_torch_weights(native_torch_optim_wrapper._model.get_weights())))
 
     def test_torchbasedoptimizer_03_invalid_methods(self):
         declearn_optim = FedOptimizer(lr=.1)
@@ -711,8 +745,8 @@ class TestSklearnBasedOptimizer(unittest.TestCase):
                 sk_model_declearn.train(self.data, self.targets)
                 dec_optim_w.step()
 
-            for (k,v_ref), (k, v) in zip(sk_model_native.get_weights().items(), sk_model_declearn.get_weights().items()):
-                self.assertTrue(np.all(np.isclose(v, v_ref)))
+            self.assertTrue(np.allclose(_flatten_numpy_weights(sk_model_declearn.get_weights()),
+                                        _flatten_numpy_weights(sk_model_native.get_weights())))
 
     def test_sklearnbasedoptimizer_02_optimizer_processing(self):
 
@@ -733,12 +767,11 @@ class TestSklearnBasedOptimizer(unittest.TestCase):
                 model_weights_before_step = copy.deepcopy(model.get_weights())
                 optim_wrapper.step()
                 model_weights_after = model.get_weights()
-                for (l, grads), (l, w_before_step), (l, w_after) in zip(model.get_gradients().items(),
-                                                                        model_weights_before_step.items(),
-                                                                        model_weights_after.items()):
-                    # check that only the declearn learning rate is used for training the model
-                    self.assertTrue(np.all(np.isclose(w_after, w_before_step - learning_rate * grads)))
-                    self.assertNotEqual(disabled_optim_hyperparameters, init_optim_hyperparameters)
+                grads = _flatten_numpy_weights(model.get_gradients())
+                # check that only the declearn learning rate is used for training the model
+                self.assertTrue(np.allclose(_flatten_numpy_weights(model_weights_after),
+                                            _flatten_numpy_weights(model_weights_before_step) - learning_rate * grads))
+                self.assertNotEqual(disabled_optim_hyperparameters, init_optim_hyperparameters)
 
             self.assertDictEqual(init_optim_hyperparameters, model.get_params())
 
@@ -954,13 +987,18 @@ class TestOptimizerBuilder(unittest.TestCase):
             AdaGradModule(),
             YogiModule()]
         self.regularizers = [FedProxRegularizer(), LassoRegularizer(), RidgeRegularizer()]
+        # (modules, regularizers) subsets used by `create_random_fedoptimizer`, drawn with a fixed seed
+        rng = random.Random(42)
+        self._subset_pairs = [
+            (_random_subset(rng, self.modules), _random_subset(rng, self.regularizers))
+            for _ in range(10)
+        ]
 
     def tearDown(self) -> None:
         return super().tearDown()
 
-    def create_random_fedoptimizer(self, lr: float = .12345, w_decay: float = .54321) -> FedOptimizer:
-        selected_modules = random.sample(self.modules, random.randint(0, len(self.modules)))
-        selected_reg = random.sample(self.regularizers, random.randint(0, len(self.regularizers)))
+    def create_random_fedoptimizer(self, index: int, lr: float = .12345, w_decay: float = .54321) -> FedOptimizer:
+        selected_modules, selected_reg = self._subset_pairs[index]
 
         optim = FedOptimizer(lr=lr,
                              decay=w_decay,
@@ -970,8 +1008,8 @@ class TestOptimizerBuilder(unittest.TestCase):
 
     def test_01_correct_build_optimizer(self):
         optim_builder = OptimizerBuilder()
-        nb_tests = 10
-        random_declearn_optim = [self.create_random_fedoptimizer() for _ in range(nb_tests)]
+        nb_tests = len(self._subset_pairs)
+        random_declearn_optim = [self.create_random_fedoptimizer(i) for i in range(nb_tests)]
         # check that NativeTorchOptimizer and DeclearnOptimizer are correclty built
         for torch_model in self.torch_models:
 
@@ -2,10 +2,7 @@ import os
 import shutil
 import tempfile
 import unittest
-from unittest.mock import MagicMock, call, create_autospec, patch
-
-
-from testsupport.fake_training_plan import FakeTorchTrainingPlan
+from unittest.mock import MagicMock, Mock, call, create_autospec, patch
 
 from fedbiomed.common.constants import TrainingPlanApprovalStatus
 from fedbiomed.common.message import (
@@ -13,38 +10,55 @@ from fedbiomed.common.message import (
 )
 from fedbiomed.common.optimizers import AuxVar, EncryptedAuxVar
 from fedbiomed.common.training_args import TrainingArgs
-from fedbiomed.common.training_plans import BaseTrainingPlan
 from fedbiomed.researcher.datasets import FederatedDataSet
 from fedbiomed.researcher.requests import DiscardOnTimeout, Requests
 from fedbiomed.researcher.federated_workflows.jobs import \
     Job, TrainingJob, TrainingPlanApproveJob, TrainingPlanCheckJob
 from fedbiomed.researcher.config import config
 
+
+# node independent fields of the train requests / replies exchanged in the tests
+TRAIN_REQUEST_TEMPLATE = {
+    'request_id': 'this_request',
+    'researcher_id': 'test-id',
+    'experiment_id': 'some_id',
+    'training_args': {},
+    'training': True,
+    'model_args': {},
+    'round': 1,
+    'aggregator_args': {},
+    'aux_vars': [{}, 'node-specific'],
+}
+
+TRAIN_REPLY_TEMPLATE = {
+    'request_id': 'this_request',
+    'researcher_id': 'test-id',
+    'experiment_id': 'some_id',
+    'msg': '',
+    'state_id': None,
+    'sample_size': None,
+    'encrypted': False,
+    'params': None,
+    'optimizer_args': None,
+    'encryption_factor': None,
+}
+
+
 class TestJob(unittest.TestCase):
     """Tests Job class and all of its subclasses"""
     def setUp(self):
-        self.patch_serializer = patch("fedbiomed.common.serializer.Serializer")
-        self.mock_serializer = self.patch_serializer.start()
-
         self.request_mock = MagicMock(spec=Requests)
         self.federated_request_mock = MagicMock()
         self.request_mock.send.return_value.__enter__.return_value = self.federated_request_mock
 
-        # Globally create mock for Model and FederatedDataset
-        self.model = create_autospec(BaseTrainingPlan, instance=False)
+        # Globally create mock for FederatedDataset
         self.fds = MagicMock(spec=FederatedDataSet)
         self.fds.data = MagicMock(return_value={})
-        self.model = FakeTorchTrainingPlan
-        self.model.save_code = MagicMock()
 
     def tearDown(self) -> None:
 
-        self.patch_serializer.stop()
-
         # Remove if there is dummy model file
-        tmp_dir = os.path.join(config.vars['TMP_DIR'], 'tmp_models')
-        if os.path.isdir(tmp_dir):
-            shutil.rmtree(tmp_dir)
+        shutil.rmtree(os.path.join(config.vars['TMP_DIR'], 'tmp_models'), ignore_errors=True)
 
         super().tearDown()
 
@@ -93,20 +107,15 @@ class TestJob(unittest.TestCase):
         self.assertEqual(r, job._reqs)
 
 
+    @patch('fedbiomed.researcher.federated_workflows.jobs._training_job.Serializer')
     @patch('fedbiomed.researcher.federated_workflows.'
         '_training_plan_workflow.uuid.uuid4', return_value='UUID')
-    def test_job_02_training_job_successful(self, mock_uuid):
+    def test_job_02_training_job_successful(self, mock_uuid, mock_serializer):
 
         # Initializing a training plan instance via Job must call:
         # 1) the training plan's default constructor
         # 2) training plan's post init
-        mock_tp_class = MagicMock()
-        mock_tp_class.return_value = MagicMock(spec=BaseTrainingPlan)
-        mock_tp_class.__name__ = 'mock_tp_class'
-
-        mock_tp = mock_tp_class()
-        mock_tp.get_model_params.return_value = MagicMock(spec=dict)
-        mock_tp.source.return_value = MagicMock(spec=str)
+        mock_tp = self._mock_training_plan()
 
         fake_node_state_ids = {
             'alice': 'alide_nsid',
@@ -191,22 +200,20 @@ class TestJob(unittest.TestCase):
                             }
                         })
                     self.assertDictEqual(training_replies, expected_replies)
+                    # params received from each node are saved to its `params_path`
+                    for reply in expected_replies.values():
+                        mock_serializer.dump.assert_any_call(reply['params'], reply['params_path'])
 
 
+    @patch('fedbiomed.researcher.federated_workflows.jobs._training_job.Serializer')
     @patch('fedbiomed.researcher.federated_workflows.'
         '_training_plan_workflow.uuid.uuid4', return_value='UUID')
-    def test_job_03_training_job_failed(self, mock_uuid):
+    def test_job_03_training_job_failed(self, mock_uuid, mock_serializer):
 
         # Initializing a training plan instance via Job must call:
         # 1) the training plan's default constructor
         # 2) training plan's post init
-        mock_tp_class = MagicMock()
-        mock_tp_class.return_value = MagicMock(spec=BaseTrainingPlan)
-        mock_tp_class.__name__ = 'mock_tp_class'
-
-        mock_tp = mock_tp_class()
-        mock_tp.get_model_params.return_value = MagicMock(spec=dict)
-        mock_tp.source.return_value = MagicMock(spec=str)
+        mock_tp = self._mock_training_plan()
 
         fake_node_state_ids = {
             'alice': 'alide_nsid',
@@ -343,13 +350,7 @@ class TestJob(unittest.TestCase):
 
         mock_policy_dot = MagicMock(spec=DiscardOnTimeout)
 
-        mock_tp_class = MagicMock()
-        mock_tp_class.return_value = MagicMock(spec=BaseTrainingPlan)
-        mock_tp_class.__name__ = 'mock_tp_class'
-
-        mock_tp = mock_tp_class()
-        mock_tp.get_model_params.return_value = MagicMock(spec=dict)
-        mock_tp.source.return_value = MagicMock(spec=str)
+        mock_tp = self._mock_training_plan()
 
         success_status_all =[
             {'alice': True, 'bob': True},
@@ -405,13 +406,7 @@ class TestJob(unittest.TestCase):
 
         mock_policy_dot = MagicMock(spec=DiscardOnTimeout)
 
-        mock_tp_class = MagicMock()
-        mock_tp_class.return_value = MagicMock(spec=BaseTrainingPlan)
-        mock_tp_class.__name__ = 'mock_tp_class'
-
-        mock_tp = mock_tp_class()
-        mock_tp.get_model_params.return_value = MagicMock(spec=dict)
-        mock_tp.source.return_value = MagicMock(spec=str)
+        mock_tp = self._mock_training_plan()
 
         error_status_all = [
             {'alice': True, 'bob': True},
@@ -502,12 +497,11 @@ class TestJob(unittest.TestCase):
                                     self.federated_request_mock.replies.return_value
                                 )
 
-    def test_job_06_training_job_encrypted_aux_var(self):
+    @patch('fedbiomed.researcher.federated_workflows.jobs._training_job.Serializer')
+    def test_job_06_training_job_encrypted_aux_var(self, mock_serializer):
         """Test that (mock) encrypted auxiliary variables are properly parsed."""
         # Set up a mock TrainingPlan.
-        mock_tp = create_autospec(spec=BaseTrainingPlan, instance=True)
-        mock_tp.get_model_params.return_value = MagicMock(spec=dict)
-        mock_tp.source.return_value = MagicMock(spec=str)
+        mock_tp = self._mock_training_plan()
         # Set up stub node state ids.
         fake_node_state_ids = {
             'node-1': 'node-1_nsid',
@@ -573,6 +567,14 @@ class TestJob(unittest.TestCase):
             [call(reply_1["optim_aux_var"]), call(reply_2["optim_aux_var"])]
         )
 
+    @staticmethod
+    def _mock_training_plan():
+        """Mocks a training plan: jobs only use its `source` and `get_model_params` methods"""
+        return Mock(
+            get_model_params=Mock(return_value=MagicMock(spec=dict)),
+            source=Mock(return_value=MagicMock(spec=str)),
+        )
+
     def _get_train_request(self,
                            mock_tp,
                            secagg_arguments,
@@ -580,21 +582,13 @@ class TestJob(unittest.TestCase):
                            state_ids,
                            data):
         return {
-            'request_id': 'this_request',
-            'researcher_id': 'test-id',
-            'experiment_id': 'some_id',
-            'training_args': {},
-            'training': True,
-            'model_args': {},
-            'round': 1,
+            **TRAIN_REQUEST_TEMPLATE,
             'training_plan': mock_tp.source(),
             'training_plan_class': mock_tp.__class__.__name__,
             'params': mock_tp.get_model_params(),
             'secagg_servkey_id': secagg_arguments.get('secagg_servkey_id'),
             'secagg_random': secagg_arguments.get('secagg_random'),
             'secagg_clipping_range': secagg_arguments.get('secagg_clipping_range'),
-            'aggregator_args': {},
-            'aux_vars': [{}, 'node-specific'],
             'state_id': state_ids[node_id],
             'dataset_id': data[node_id]['dataset_id'],
         }
@@ -605,21 +599,12 @@ class TestJob(unittest.TestCase):
                          optim_aux_var,
                          success=True):
         return {
-            'request_id': 'this_request',
-            'researcher_id': 'test-id',
-            'experiment_id': 'some_id',
+            **TRAIN_REPLY_TEMPLATE,
+            'timing': {'rtime_total': 0},
             'success': success,
             'node_id': node_id,
             'dataset_id': dataset_id,
-            'timing': {'rtime_total': 0},
-            'msg': '',
-            'state_id': None,
-            'sample_size': None,
-            'encrypted': False,
-            'params': None,
-            'optimizer_args': None,
             'optim_aux_var': optim_aux_var,
-            'encryption_factor': None,
         }
 
     def _get_error_message(self,
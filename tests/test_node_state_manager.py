@@ -9,52 +9,60 @@ from fedbiomed.node.node_state_manager import NodeStateManager, NodeStateFileNam
 from testsupport.fake_uuid import FakeUuid
 
 
-class TestNodeStateManager(unittest.TestCase):
+# `NodeStateManager.add` adds header entries to the state it is given: tests pass it a (shallow) copy
+FAKE_DECLEARN_OPTIMIZER_STATE = {
+    'config': {
+        'lrate': 0.2, 'w_decay': 0.0, 'regularizers': [],
+        'modules': [('adam', {'beta_1': 0.9, 'beta_2': 0.99, 'amsgrad': False, 'eps': 1e-07})]
+    },
+    'states': {
+        'modules': [('adam', {'steps': 0, 'vmax': None, 'momentum': {'state': 0.0}, 'velocity': {'state': 0.0}})]
+    }
+}
+
+# `FakeUuid` is stateless: a single instance is returned by all patched `uuid.uuid4`
+FAKE_UUID = FakeUuid()
+FAKE_STATE_ID = NODE_STATE_PREFIX + str(FakeUuid.VALUE)
 
-    def setUp(self) -> None:
-        self.query_patcher = patch('fedbiomed.node.node_state_manager.Query')
-        self.table_patcher = patch('fedbiomed.node.node_state_manager.TinyDB')
 
-        self.temp_dir = tempfile.TemporaryDirectory()
+class TestNodeStateManager(unittest.TestCase):
 
-        self.query_mock = self.query_patcher.start()
-        self.table_mock = self.table_patcher.start()
-        self.test_nsm = NodeStateManager(
-            dir=self.temp_dir.name,
-            node_id='test-node-id',
-            db_path="path/to/db"
-        )
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        # database is only mocked while building the manager: tests then mock its query and table
+        with (
+            patch('fedbiomed.node.node_state_manager.Query'),
+            patch('fedbiomed.node.node_state_manager.TinyDB'),
+        ):
+            cls._nsm_template = NodeStateManager(
+                dir=cls.temp_dir.name,
+                node_id='test-node-id',
+                db_path="path/to/db"
+            )
 
-        self.fake_declearn_optimizer_state = {'config': {'lrate': 0.2, 'w_decay': 0.0, 'regularizers': [], 'modules': [
-            ('adam', {'beta_1': 0.9, 'beta_2': 0.99, 'amsgrad': False, 'eps': 1e-07})]
-                                 }, 'states': {'modules': [
-                                     ('adam', {'steps': 0, 'vmax': None, 'momentum': {'state': 0.0}, 'velocity': {'state': 0.0}})]}}
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
 
-    def tearDown(self) -> None:
-        self.query_patcher.stop()
-        self.table_patcher.stop()
-        self.temp_dir.cleanup()
+    def setUp(self) -> None:
+        self.test_nsm = copy.copy(self._nsm_template)
+        self.test_nsm._query = self.query_mock = MagicMock()
+        self.test_nsm._db = self.table_mock = MagicMock()
 
     def test_node_state_manager_1_fail_to_build(self):
-        query_patcher = patch('fedbiomed.node.node_state_manager.Query')
-        table_mock = MagicMock(table=MagicMock(side_effect=NameError("this is a test")))
-        db_patcher = patch('fedbiomed.node.node_state_manager.TinyDB', return_value = table_mock)
-        table_patcher = patch('fedbiomed.node.node_state_manager.TinyDB.table')
-
-        query_patcher.start()
-        table_patcher.start()
-        db_patcher.start()
+        with (
+            patch('fedbiomed.node.node_state_manager.Query'),
+            patch('fedbiomed.node.node_state_manager.TinyDB') as tinydb_mock,
+        ):
+            tinydb_mock.return_value.table.side_effect = NameError("this is a test")
 
-        with self.assertRaises(FedbiomedNodeStateManagerError):
-            nsm = NodeStateManager(
-                self.temp_dir.name,
-                'test-node-id',
-                'path/to/db'
-            )
-
-        query_patcher.stop()
-        table_patcher.stop()
-        db_patcher.stop()
+            with self.assertRaises(FedbiomedNodeStateManagerError):
+                nsm = NodeStateManager(
+                    self.temp_dir.name,
+                    'test-node-id',
+                    'path/to/db'
+                )
 
 
     @patch('fedbiomed.node.node_state_manager.raise_for_version_compatibility')
@@ -64,7 +72,7 @@ class TestNodeStateManager(unittest.TestCase):
         experiment_id , state_id = 'experiment_id' , 'state_id'
         self.query_mock.experiment_id = MagicMock(return_value=experiment_id)
         self.query_mock.state_id = MagicMock(return_value=state_id)
-        self.table_mock.return_value.table.return_value.get.return_value = {
+        self.table_mock.get.return_value = {
             "version_node_id" : '1.2.3',
             'state_id': state_id,
             'experiment_id': experiment_id,
@@ -73,7 +81,7 @@ class TestNodeStateManager(unittest.TestCase):
         test_nsm = self.test_nsm
         res = test_nsm.get(experiment_id, state_id)
 
-        self.table_mock.return_value.table.return_value.get.assert_called_once_with(
+        self.table_mock.get.assert_called_once_with(
             (self.query_mock.experiment_id == experiment_id) & (self.query_mock.state_id == state_id)
         )
         self.assertIsInstance(res, dict)
@@ -89,8 +97,7 @@ class TestNodeStateManager(unittest.TestCase):
                 self.test_nsm.get(experiment_id, state_id)
 
         # test second error: when database extraction request fails (in `_load_state` private method)
-        self.table_mock.return_value.table.return_value.get.side_effect = RuntimeError("error raised for the sake of"
-                                                                                       " testing!")
+        self.table_mock.get.side_effect = RuntimeError("error raised for the sake of testing!")
         with self.assertRaises(FedbiomedNodeStateManagerError):
             self.test_nsm.get(experiment_id, state_id)
 
@@ -101,37 +108,34 @@ class TestNodeStateManager(unittest.TestCase):
 
         # TODO: add states that are framework native (here we are using format that is very similar to Declearn optimizers)
 
-        expected_state_id = NODE_STATE_PREFIX + str(FakeUuid.VALUE)
+        expected_state_id = FAKE_STATE_ID
         header = {
             "version_node_id": str(__node_state_version__),
             "state_id": expected_state_id,
             "experiment_id": experiment_id
         }
 
-        uuid_patch.return_value = FakeUuid()
+        uuid_patch.return_value = FAKE_UUID
 
-        self.query_mock.return_value.state_id = expected_state_id
+        self.query_mock.state_id = expected_state_id
         self.test_nsm.initialize()
-        res = self.test_nsm.add(experiment_id, self.fake_declearn_optimizer_state)
+        res = self.test_nsm.add(experiment_id, dict(FAKE_DECLEARN_OPTIMIZER_STATE))
 
         # checks
-        expected_state = copy.deepcopy(self.fake_declearn_optimizer_state)
-        expected_state.update(header)
+        expected_state = {**FAKE_DECLEARN_OPTIMIZER_STATE, **header}
         self.assertEqual(res, expected_state_id)
-        self.table_mock.return_value.table.return_value.upsert.assert_called_once_with(
+        self.table_mock.upsert.assert_called_once_with(
             expected_state, True
         )
 
     @patch('uuid.uuid4', autospec=True)
     def test_node_state_manager_5_add_saving_failure(self, uuid_patch):
         # test case where private `_save_state` method fails
-        uuid_patch.return_value = FakeUuid()
-        self.table_mock.return_value.table.return_value.upsert = MagicMock(
-            side_effect=RuntimeError("this error is raised for the sake of testing")
-            )
+        uuid_patch.return_value = FAKE_UUID
+        self.table_mock.upsert.side_effect = RuntimeError("this error is raised for the sake of testing")
 
         with self.assertRaises(FedbiomedNodeStateManagerError):
-            self.test_nsm.add(experiment_id='experiment_id', state=self.fake_declearn_optimizer_state)
+            self.test_nsm.add(experiment_id='experiment_id', state=dict(FAKE_DECLEARN_OPTIMIZER_STATE))
 
 
     def test_node_state_manager_6_initialize_node_state_manager(self):
@@ -163,7 +167,7 @@ class TestNodeStateManager(unittest.TestCase):
         experiment_id, round_nb, opt_file_name = 'experiment_id', 4321, \
             MagicMock(spec=NodeStateFileName, value=file_name)
 
-        uuid_patch.return_value = FakeUuid()
+        uuid_patch.return_value = FAKE_UUID
         state_id = FakeUuid.VALUE
         with patch('os.makedirs') as os_mkdirs_mock:
             self.test_nsm.initialize()
@@ -204,7 +208,7 @@ class TestNodeStateManager(unittest.TestCase):
                                                                round_nb,
                                                                opt_file_name)
 
-        uuid_patch.return_value = FakeUuid()
+        uuid_patch.return_value = FAKE_UUID
         with patch('os.makedirs') as os_mkdirs_mock:
             self.test_nsm.initialize()
             os_mkdirs_mock.reset_mock()
@@ -218,14 +222,13 @@ class TestNodeStateManager(unittest.TestCase):
 
 class TestNodeStateFileName(unittest.TestCase):
     def test_node_state_file_name_1_correct_format_entries(self):
-        # here we test that all entries of NodeStateFIleName enum class respect convention
-
+        # here we test that all entries of NodeStateFIleName enum class respect convention:
+        # formatting an entry that does not expect exactly two `%s` raises a TypeError
         for entry_value in NodeStateFileName.list():
-            try:
-                entry_value % ('string_1', 'string_2')
-            except TypeError as te:
-                self.assertTrue(False, f"error in NodeStateFileName, entry {entry_value} doesnot respect formatting convention"
-                                f" details : {te}")
+            with self.subTest(entry=entry_value):
+                formatted = entry_value % ('string_1', 'string_2')
+                self.assertIn('string_1', formatted)
+                self.assertIn('string_2', formatted)
 
 
 if __name__ == '__main__':  # pragma: no cover
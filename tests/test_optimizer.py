@@ -3,6 +3,7 @@
 
 """Unit tests for the declearn-interfacing Optimizer class."""
 
+import copy
 import json
 from typing import Dict, List
 import unittest
@@ -24,9 +25,42 @@ from fedbiomed.common.optimizers.declearn import (
 from fedbiomed.common.optimizers.optimizer import Optimizer
 
 
+def _mock_module(aux_name=None) -> mock.MagicMock:
+    """Return a mock OptiModule, lighter to build than an autospec.
+
+    The `spec` is kept so that the mock passes declearn's type checks.
+    """
+    module = mock.MagicMock(spec=OptiModule)
+    module.aux_name = aux_name
+    return module
+
+
+def _mock_regularizer() -> mock.MagicMock:
+    """Return a mock Regularizer, lighter to build than an autospec."""
+    return mock.MagicMock(spec=Regularizer)
+
+
 class TestOptimizer(unittest.TestCase):
     """Unit tests for the declearn-interfacing Optimizer class."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up an Optimizer with an Adam module and a FedProx regularizer,
+        and run a step to build Vector states, for the state-related tests."""
+        rng = np.random.default_rng(0)  # seeded, so that failures are reproducible
+        cls.grads = Vector.build({
+            "kernel": rng.normal(size=(8, 4)),
+            "bias": rng.normal(size=(4,))
+        })
+        cls.weights = Vector.build({
+            "kernel": rng.normal(size=(8, 4)),
+            "bias": rng.normal(size=(4,))
+        })
+        cls.stepped_optim = Optimizer(lr=0.001, modules=["adam"], regularizers=["fedprox"])
+        cls.stepped_optim.step(cls.grads, cls.weights)
+        # Update that a second step of that Optimizer yields (run on a copy).
+        cls.reference_update = copy.deepcopy(cls.stepped_optim).step(cls.grads, cls.weights)
+
     def test_optimizer_01_init(self) -> None:
         """Test that Optimizer instantiation works as expected.
 
@@ -34,8 +68,8 @@ class TestOptimizer(unittest.TestCase):
         specifications are not tested here, as they belong to the domain
         of the declearn dependency (which runs such tests itself).
         """
-        modules = [mock.create_autospec(OptiModule, instance=True)]
-        regularizers = [mock.create_autospec(Regularizer, instance=True)]
+        modules = [_mock_module()]
+        regularizers = [_mock_regularizer()]
         optim = Optimizer(
             lr=1e-3,
             decay=1e-4,
@@ -60,14 +94,14 @@ class TestOptimizer(unittest.TestCase):
 
     def test_optimizer_03_init_round(self) -> None:
         """Test that `Optimizer.init_round` works as expected."""
-        regul = mock.create_autospec(Regularizer, instance=True)
+        regul = _mock_regularizer()
         optim = Optimizer(lr=1e-3, regularizers=[regul])
         optim.init_round()
         regul.on_round_start.assert_called_once()
 
     def test_optimizer_04_init_round_fails(self) -> None:
         """Test that `Optimizer.init_round` exceptions are wrapped."""
-        regul = mock.create_autospec(Regularizer, instance=True)
+        regul = _mock_regularizer()
         regul.on_round_start.side_effect = RuntimeError
         optim = Optimizer(lr=1e-3, regularizers=[regul])
         with self.assertRaises(FedbiomedOptimizerError):
@@ -84,10 +118,10 @@ class TestOptimizer(unittest.TestCase):
         lrate = mock.MagicMock(spec=Scheduler)
         decay = mock.MagicMock(spec=Scheduler)
         modules = [
-            mock.create_autospec(OptiModule, instance=True) for _ in range(3)
+            _mock_module() for _ in range(3)
         ]
         regularizers = [
-            mock.create_autospec(Regularizer, instance=True) for _ in range(2)
+            _mock_regularizer() for _ in range(2)
         ]
         optim = Optimizer(
             lr=lrate,
@@ -126,60 +160,51 @@ class TestOptimizer(unittest.TestCase):
             optim.step(grads=None, weights=None)
 
     def test_optimizer_07_get_aux(self) -> None:
-        """Test `Optimizer.set_aux` using a mock Module."""
+        """Test `Optimizer.get_aux` using mock Modules, and its failure cases."""
         # Set up an Optimizer, and mock modules, one of which emits aux vars.
         mockaux = mock.create_autospec(AuxVar, instance=True)
-        mod_aux = mock.create_autospec(OptiModule, instance=True)
+        mod_aux = _mock_module(aux_name="mock-module-1")
         mod_aux.collect_aux_var.return_value = mockaux
-        setattr(mod_aux, "aux_name", "mock-module-1")
-        mod_nox = mock.create_autospec(OptiModule, instance=True)
+        mod_nox = _mock_module(aux_name="mock-module-2")
         mod_nox.collect_aux_var.return_value = None
-        setattr(mod_nox, "aux_name", "mock-module-2")
         optim = Optimizer(lr=0.001, modules=[mod_aux, mod_nox])
-        # Call 'get_aux' and assert that the results match expectations.
-        aux = optim.get_aux()
-        self.assertDictEqual(aux, {"mock-module-1": mockaux})
-        mod_aux.collect_aux_var.assert_called_once()
-        mod_nox.collect_aux_var.assert_called_once()
-
-    def test_optimizer_08_get_aux_none(self) -> None:
-        """Test `Optimizer.get_aux` when there are no aux-var to share."""
-        optim = Optimizer(lr=0.001)
-        self.assertDictEqual(optim.get_aux(), {})
-
-    def test_optimizer_09_get_aux_fails(self) -> None:
-        """Test that `Optimizer.get_aux` exceptions are wrapped."""
-        module = mock.create_autospec(OptiModule, instance=True)
-        module.collect_aux_var.side_effect = RuntimeError
-        optim = Optimizer(lr=0.001, modules=[module])
-        with self.assertRaises(FedbiomedOptimizerError):
-            optim.get_aux()
+        with self.subTest("present"):
+            # Call 'get_aux' and assert that the results match expectations.
+            aux = optim.get_aux()
+            self.assertDictEqual(aux, {"mock-module-1": mockaux})
+            mod_aux.collect_aux_var.assert_called_once()
+            mod_nox.collect_aux_var.assert_called_once()
+        with self.subTest("fails"):
+            # Test that exceptions raised by modules are wrapped.
+            mod_aux.reset_mock()
+            mod_aux.collect_aux_var.side_effect = RuntimeError
+            with self.assertRaises(FedbiomedOptimizerError):
+                optim.get_aux()
+        with self.subTest("empty"):
+            # Test the case when there are no aux-var to share.
+            self.assertDictEqual(Optimizer(lr=0.001).get_aux(), {})
 
     def test_optimizer_10_set_aux(self) -> None:
-        """Test `Optimizer.set_aux` using a mock Module."""
+        """Test `Optimizer.set_aux` using a mock Module, and its failure cases."""
         # Set up an Optimizer, a mock module and mock aux-var inputs.
-        module = mock.create_autospec(OptiModule, instance=True)
-        setattr(module, "aux_name", "mock-module")
+        module = _mock_module(aux_name="mock-module")
         optim = Optimizer(lr=0.001, modules=[module])
         state = mock.MagicMock()
-        # Call 'set_aux' and assert that the information was passed.
-        optim.set_aux({"mock-module": state})
-        module.process_aux_var.assert_called_once_with(state)
-
-    def test_optimizer_11_set_aux_none(self) -> None:
-        """Test `Optimizer.set_aux` when there are no aux-var to share."""
-        optim = Optimizer(lr=0.001)
-        self.assertIsNone(optim.set_aux({}))
-
-    def test_optimizer_12_set_aux_fails(self) -> None:
-        """Test `Optimizer.set_aux` exception-catching."""
-        optim = Optimizer(lr=0.001)
-        with self.assertRaises(FedbiomedOptimizerError):
-            optim.set_aux({"missing": {}})
+        with self.subTest("present"):
+            # Call 'set_aux' and assert that the information was passed.
+            optim.set_aux({"mock-module": state})
+            module.process_aux_var.assert_called_once_with(state)
+        with self.subTest("fails"):
+            # Test that aux-var for a missing module are rejected.
+            with self.assertRaises(FedbiomedOptimizerError):
+                optim.set_aux({"missing": {}})
+        with self.subTest("empty"):
+            # Test the case when there are no aux-var to share.
+            self.assertIsNone(Optimizer(lr=0.001).set_aux({}))
 
     def test_optimizer_13_get_state_mock(self) -> None:
         """Test that `Optimizer.get_state` returns a dict and calls modules."""
-        module = mock.create_autospec(OptiModule, instance=True)
+        module = _mock_module()
         optim = Optimizer(lr=0.001, modules=[module])
         state = optim.get_state()
         self.assertIsInstance(state, dict)
@@ -188,7 +213,7 @@ class TestOptimizer(unittest.TestCase):
 
     def test_optimizer_14_get_state_fails(self) -> None:
         """Test that `Optimizer.get_state` exceptions are wrapped."""
-        module = mock.create_autospec(OptiModule, instance=True)
+        module = _mock_module()
         module.get_state.side_effect = RuntimeError
         optim = Optimizer(lr=0.001, modules=[module])
         with self.assertRaises(FedbiomedOptimizerError):
@@ -200,19 +225,8 @@ class TestOptimizer(unittest.TestCase):
         Use a practical case to test so, with an Adam module and a FedProx
         regularizer.
         """
-        # Set up an Optimizer and run a step to build Vector states.
-        optim = Optimizer(lr=0.001, modules=["adam"], regularizers=["fedprox"])
-        grads = Vector.build({
-            "kernel": np.random.normal(size=(8, 4)),
-            "bias": np.random.normal(size=(4,))
-        })
-        weights = Vector.build({
-            "kernel": np.random.normal(size=(8, 4)),
-            "bias": np.random.normal(size=(4,))
-        })
-        optim.step(grads, weights)
         # Check that states can be accessed, dumped to JSON and reloaded.
-        state = optim.get_state()
+        state = self.stepped_optim.get_state()
         sdump = json.dumps(state, default=declearn.utils.json_pack)
         self.assertIsInstance(sdump, str)
         sload = json.loads(sdump, object_hook=declearn.utils.json_unpack)
@@ -225,26 +239,14 @@ class TestOptimizer(unittest.TestCase):
         Use a practical case to test so, with an Adam module and a FedProx
         regularizer.
         """
-        # Set up an Optimizer and run a step to build Vector states.
-        optim = Optimizer(lr=0.001, modules=["adam"], regularizers=["fedprox"])
-        grads = Vector.build({
-            "kernel": np.random.normal(size=(8, 4)),
-            "bias": np.random.normal(size=(4,))
-        })
-        weights = Vector.build({
-            "kernel": np.random.normal(size=(8, 4)),
-            "bias": np.random.normal(size=(4,))
-        })
-        optim.step(grads, weights)
-        # Gather the state of that Optimizer and build a new one from it.
-        state = optim.get_state()
+        # Gather the state of the shared Optimizer and build a new one from it.
+        state = self.stepped_optim.get_state()
         opt_b = Optimizer.load_state(state)
         # Check that the loaded Optimizer is the same as the original one.
         self.assertIsInstance(opt_b, Optimizer)
         self.assertEqual(opt_b.get_state(), state)
-        upd_a = optim.step(grads, weights)
-        upd_b = opt_b.step(grads, weights)
-        self.assertEqual(upd_a, upd_b)
+        upd_b = opt_b.step(self.grads, self.weights)
+        self.assertEqual(upd_b, self.reference_update)
 
     def test_optimizer_17_load_state_and_aux_var(self):
         """Tests if auxiliary variables are properly re-computed when loading state
@@ -506,12 +506,15 @@ class TestFederatedRequest(unittest.TestCase):
         self.assertEqual(1, len(r.requests))
 
 
-    def test_02_federeated_request_send(self):
+    @patch('fedbiomed.researcher.requests._requests.NodeAgent.send_many')
+    def test_02_federeated_request_send(self, send_many):
 
         self.federated_request.send()
 
-        self.node_1.send.assert_called_once_with(self.message_1, ANY)
-        self.node_2.send.assert_called_once_with(self.message_1, ANY)
+        send_many.assert_called_once_with([
+            (self.node_1, self.message_1, ANY),
+            (self.node_2, self.message_1, ANY),
+        ])
 
 
     def test_03_federated_request_wait(self):
@@ -519,7 +522,8 @@ class TestFederatedRequest(unittest.TestCase):
         self.policy_mock.return_value.continue_all.side_effect = [ PolicyStatus.CONTINUE, PolicyStatus.COMPLETED]
         self.federated_request.wait()
 
-    def test_04_federaeted_request_with_context_manager(self):
+    @patch('fedbiomed.researcher.requests._requests.NodeAgent.send_many')
+    def test_04_federaeted_request_with_context_manager(self, send_many):
 
         self.policy_mock.return_value.continue_all.side_effect = [ PolicyStatus.CONTINUE, PolicyStatus.COMPLETED]
 
@@ -29,6 +29,21 @@ test_id = 'researcher-test-id'
 
 class TestJLSecureAggregation(MockRequestModule, unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # same patch for all tests: install it once for the class
+        cls.p1 = patch(
+            "fedbiomed.researcher.secagg._secure_aggregation.SecaggServkeyContext.setup",
+            autospec=True,
+        )
+        cls.p1.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.p1.stop()
+        super().tearDownClass()
+
     def setUp(self) -> None:
 
         super().setUp(module="fedbiomed.researcher.secagg._secagg_context.Requests")
@@ -36,31 +51,22 @@ class TestJLSecureAggregation(MockRequestModule, unittest.TestCase):
         self.temp_dir = tempfile.TemporaryDirectory()
         config.load(root=self.temp_dir.name)
 
-        self.p1 = patch(
-            "fedbiomed.researcher.secagg._secure_aggregation.SecaggServkeyContext.setup",
-            autospec=True,
-        )
-        self.p1.start()
         self.secagg = JoyeLibertSecureAggregation()
 
-
-
     def tearDown(self) -> None:
         super().tearDown()
-        self.p1.stop()
         self.temp_dir.cleanup()
 
     def test_jl_secure_aggregation_01_init_raises(self):
         """Tests invalid argument for __init__"""
 
-        with self.assertRaises(FedbiomedSecureAggregationError):
-            JoyeLibertSecureAggregation(active="111")
-
-        with self.assertRaises(FedbiomedSecureAggregationError):
-            JoyeLibertSecureAggregation(clipping_range="Not an integer")
-
-        with self.assertRaises(FedbiomedSecureAggregationError):
-            JoyeLibertSecureAggregation(clipping_range=[True])
+        for kwargs in (
+            {"active": "111"},
+            {"clipping_range": "Not an integer"},
+            {"clipping_range": [True]},
+        ):
+            with self.subTest(**kwargs), self.assertRaises(FedbiomedSecureAggregationError):
+                JoyeLibertSecureAggregation(**kwargs)
 
     def test_jl_secure_aggregation_02_activate(self):
         """Tests secure aggregation activation"""
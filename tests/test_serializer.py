@@ -185,6 +185,18 @@ class TestSerializer(unittest.TestCase):
         auxvar = ScaffoldAuxVar(state=vector)
         self.assert_serializable(auxvar)
 
+    def test_serializer_15_dumps_buffer(self) -> None:
+        """Test that 'Serializer.dumps_buffer' returns a view on 'dumps' bytes."""
+        obj = {"a": np.random.normal(size=(32, 128)), "b": [1, "2", (3,)]}
+        view = Serializer.dumps_buffer(obj)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(bytes(view), Serializer.dumps(obj))
+        # Test that chunks of the view can be joined and de-serialized.
+        chunks = [bytes(view[i:i + 1000]) for i in range(0, len(view), 1000)]
+        bis = Serializer.loads(b"".join(chunks))
+        self.assertTrue(np.all(bis["a"] == obj["a"]))
+        self.assertEqual(bis["b"], obj["b"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,32 +9,33 @@ from fedbiomed.common.exceptions import FedbiomedTypeError
 
 class TestSkLearnDataManager(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Data shared by all tests: they are only read, never modified
+        cls.inputs = np.array([[1, 4, 3, 7],
+                               [4, 6, 3, 1],
+                               [1, 5, 3, 7],
+                               [8, 2, 6, 9]
+                               ])
+        cls.target = np.array([5, 5, 1, 4])
+        cls.n_samples = cls.inputs.shape[0]
+        cls.inputs_df = pd.DataFrame(cls.inputs)
+        cls.target_df = pd.DataFrame(cls.target)
+
     def setUp(self):
-        # Setup global TorchDataset class
-        self.inputs = np.array([[1, 4, 3, 7],
-                                [4, 6, 3, 1],
-                                [1, 5, 3, 7],
-                                [8, 2, 6, 9]
-                                ])
-        self.target = np.array([5, 5, 1, 4])
         self.sklearn_data_manager = SkLearnDataManager(inputs=self.inputs,
                                                        target=self.target)
 
-    def assertIterableEqual(self, it1, it2):
-        self.assertListEqual([x for x in it1], [x for x in it2])
-
     def assertNPArrayEqual(self, arr1, arr2):
-        self.assertIterableEqual(arr1.flatten(), arr2.flatten())
+        np.testing.assert_array_equal(np.ravel(arr1), np.ravel(arr2))
 
     def test_sklearn_data_manager_01_init(self):
         """ Testing dataset getter method """
 
         # Test if arguments provided as pd.DataFrame and they have been properly converted to the
         # np.ndarray
-        inputs = pd.DataFrame(self.inputs)
-        target = pd.DataFrame(self.target)
-        self.sklearn_data_manager = SkLearnDataManager(inputs=inputs,
-                                                       target=target)
+        self.sklearn_data_manager = SkLearnDataManager(inputs=self.inputs_df,
+                                                       target=self.target_df)
         self.assertIsInstance(self.sklearn_data_manager._inputs, np.ndarray)
         self.assertIsInstance(self.sklearn_data_manager._target, np.ndarray)
 
@@ -56,8 +57,7 @@ class TestSkLearnDataManager(unittest.TestCase):
         with self.assertRaises(FedbiomedTypeError):
             self.sklearn_data_manager.split(test_ratio='not-float', test_batch_size=None)
 
-        # Get number of samples
-        n_samples = len(self.sklearn_data_manager.dataset()[0])
+        n_samples = self.n_samples
 
         ratio = 0.5
         n_test = math.floor(n_samples * ratio)
@@ -84,9 +84,8 @@ class TestSkLearnDataManager(unittest.TestCase):
     def test_sklearn_data_manager_03_getter_subsets(self):
         """ Test getter for subset train and subset test"""
         ratio = 0.5
-        n_samples = len(self.sklearn_data_manager.dataset()[0])
-        n_test = math.floor(n_samples * ratio)
-        n_train = n_samples - n_test
+        n_test = math.floor(self.n_samples * ratio)
+        n_train = self.n_samples - n_test
 
         self.sklearn_data_manager.split(test_ratio=ratio, test_batch_size=None)
 
@@ -108,45 +107,33 @@ class TestSkLearnDataManager(unittest.TestCase):
 
     def test_sklearn_data_manager_05_integration_with_npdataloader(self):
         test_ratio = 0.
-        sklearn_data_manager = SkLearnDataManager(inputs=self.inputs,
-                                                  target=self.target,
-                                                  batch_size=1,
-                                                  shuffle=False,
-                                                  drop_last=False)
-
-        self.assertDictEqual({'batch_size': 1, 'shuffle': False, 'drop_last': False},
-                             sklearn_data_manager._loader_arguments)
-
-        loader_train, loader_test = sklearn_data_manager.split(test_ratio=test_ratio, test_batch_size=None)
-        self.assertEqual(len(loader_test), 0)
-
-        for i, (data, target) in enumerate(loader_train):
-            self.assertNPArrayEqual(data, self.inputs[i, :])
-            self.assertNPArrayEqual(target, self.target[i])
-
-        batch_size = 3
-        sklearn_data_manager = SkLearnDataManager(inputs=self.inputs,
-                                                  target=self.target,
-                                                  batch_size=batch_size,
-                                                  shuffle=False,
-                                                  drop_last=True)
-
-        loader_train, loader_test = sklearn_data_manager.split(test_ratio=test_ratio, test_batch_size=None)
-        self.assertEqual(len(loader_test), 0)
-
-        count_iter = 0
-        for i, (data, target) in enumerate(loader_train):
-            self.assertNPArrayEqual(data, self.inputs[:batch_size, :])
-            self.assertNPArrayEqual(target, self.target[:batch_size])
-            count_iter += 1
-
-        self.assertEqual(count_iter, 1)  # assert that only one iteration was made because of drop_last=True
-
-
-
-
-
-
+        n_samples = self.n_samples
+
+        for batch_size, drop_last in ((1, False), (3, True)):
+            with self.subTest(batch_size=batch_size, drop_last=drop_last):
+                sklearn_data_manager = SkLearnDataManager(inputs=self.inputs,
+                                                          target=self.target,
+                                                          batch_size=batch_size,
+                                                          shuffle=False,
+                                                          drop_last=drop_last)
+
+                self.assertDictEqual({'batch_size': batch_size, 'shuffle': False, 'drop_last': drop_last},
+                                     sklearn_data_manager._loader_arguments)
+
+                loader_train, loader_test = sklearn_data_manager.split(test_ratio=test_ratio, test_batch_size=None)
+                self.assertEqual(len(loader_test), 0)
+
+                # without shuffling, batches are consecutive slices of the data
+                # (the last, incomplete one is dropped if `drop_last` is True)
+                batch_starts = range(0, n_samples - batch_size + 1 if drop_last else n_samples, batch_size)
+                count_iter = 0
+                for start, (data, target) in zip(batch_starts, loader_train):
+                    self.assertNPArrayEqual(data, self.inputs[start:start + batch_size, :])
+                    self.assertNPArrayEqual(target, self.target[start:start + batch_size])
+                    count_iter += 1
+
+                self.assertEqual(count_iter, len(batch_starts))
+                self.assertEqual(len(loader_train), len(batch_starts))
 
 
 if __name__ == '__main__':  # pragma: no cover
@@ -62,12 +62,45 @@ class TestNodeAgent(unittest.IsolatedAsyncioTestCase):
         r = await self.node_agent.send_async(message=message)
         item = await self.node_agent._queue.get()
         self.assertEqual(item[0], message)
+        self.assertIsNone(item[3])
+
+        serialized = memoryview(b'serialized')
+        r = await self.node_agent.send_async(message=message, serialized=serialized)
+        item = await self.node_agent._queue.get()
+        self.assertEqual(item[0], message)
+        self.assertEqual(item[3], serialized)
 
         with patch('fedbiomed.transport.node_agent.asyncio.Queue.put') as put:
             put.side_effect = Exception
             with self.assertRaises(Exception):
                 await self.node_agent.send_async(message=message)
 
+    async def test_node_agent_05_send_many(self):
+
+        node_agent_2 = NodeAgent(id='node-2', loop=self.loop, on_forward=None)
+        NodeAgent.send_many([(self.node_agent, message, None), (node_agent_2, message, None)])
+        # Let the submitted coroutine run
+        await asyncio.sleep(0.1)
+        item = await self.node_agent._queue.get()
+        self.assertEqual(item[0], message)
+        item = await node_agent_2._queue.get()
+        self.assertEqual(item[0], message)
+
+        # Failing to send to a node does not prevent sending to the others
+        node_agent_3 = NodeAgent(id='node-3', loop=self.loop, on_forward=None)
+        with patch.object(node_agent_2, 'send_async', side_effect=Exception('send error')), \
+                patch('fedbiomed.transport.node_agent.logger') as logger:
+            NodeAgent.send_many([(node_agent_2, message, None), (node_agent_3, message, None)])
+            await asyncio.sleep(0.1)
+            logger.error.assert_called_once()
+        item = await node_agent_3._queue.get()
+        self.assertEqual(item[0], message)
+
+        # Nothing to send
+        with patch('fedbiomed.transport.node_agent.asyncio.run_coroutine_threadsafe') as run_threadsafe:
+            NodeAgent.send_many([])
+            run_threadsafe.assert_not_called()
+
     async def test_node_agent_06_get_task(self):
 
         await self.node_agent._queue.put(message)
@@ -130,6 +163,16 @@ class TestAgentStore(unittest.IsolatedAsyncioTestCase):
         result = await self.agent_store.get('node-id-1')
         self.assertEqual(result.id, 'node-id-1')
 
+    async def test_agent_store_04_wait_for_node(self):
+
+        # No node registered yet
+        result = await self.agent_store.wait_for_node(timeout=0.01)
+        self.assertFalse(result)
+
+        await self.agent_store.retrieve(node_id='node-id-1')
+        result = await self.agent_store.wait_for_node(timeout=0.01)
+        self.assertTrue(result)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
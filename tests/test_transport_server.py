@@ -1,5 +1,6 @@
 import unittest
 import asyncio
+import threading
 import time
 
 
@@ -66,14 +67,13 @@ class TestResearcherServicer(unittest.IsolatedAsyncioTestCase):
 
         node_agent = AsyncMock()
         node_agent.task_done = MagicMock()
-        node_agent.get_task.return_value = [example_task, 0 , time.time()]
+        node_agent.get_task.return_value = [example_task, 0 , time.time(), None]
 
         self.agent_store.retrieve.return_value = node_agent
         async for r in self.servicer.GetTaskUnary(request=self.request, context=self.context):
             self.assertEqual(r.iteration, 1)
             self.assertEqual(r.size, 1)
 
-
     @patch('fedbiomed.transport.server.Serializer.loads')
     async def test_researcher_servicer_02_ReplyTask(self, load):
 
@@ -116,13 +116,25 @@ class TestResearcherServicer(unittest.IsolatedAsyncioTestCase):
             node_agent.send_async = AsyncMock()
             self.agent_store.retrieve.return_value = node_agent
 
-            node_agent.get_task.return_value = [example_task, 0 , time.time()]
+            node_agent.get_task.return_value = [example_task, 0 , time.time(), None]
             task_response.side_effect = exception
 
             async for r in self.servicer.GetTaskUnary(request=self.request, context=self.context):
                 self.assertEqual(r, None)
             node_agent.send_async.assert_called_once()
 
+    @patch('fedbiomed.transport.server.Serializer.dumps_buffer')
+    async def test_researcher_servicer_05_GetTaskUnary_serialized(self, dumps_buffer):
+
+        node_agent = AsyncMock()
+        node_agent.task_done = MagicMock()
+        node_agent.get_task.return_value = [example_task, 0 , time.time(), memoryview(b'serialized')]
+
+        self.agent_store.retrieve.return_value = node_agent
+        async for r in self.servicer.GetTaskUnary(request=self.request, context=self.context):
+            self.assertEqual(r.bytes_, b'serialized')
+        dumps_buffer.assert_not_called()
+
 
 class TestGrpcAsyncServer(unittest.IsolatedAsyncioTestCase):
 
@@ -192,10 +204,26 @@ class TestGrpcAsyncServer(unittest.IsolatedAsyncioTestCase):
         agents = {'node-1': AsyncMock(spec=NodeAgent), 'node-2': AsyncMock(spec=NodeAgent)}
         self.agent_store_mock.return_value.get_all.return_value = agents
         await self.grpc_server.start()
-        await self.grpc_server.broadcast(example_task)
+        with patch('fedbiomed.transport.server.Serializer.dumps_buffer') as dumps_buffer:
+            await self.grpc_server.broadcast(example_task)
+            dumps_buffer.assert_called_once()
+        agents['node-1'].send_async.assert_called_once()
         agents['node-2'].send_async.assert_called_once()
+
+        # Failure on one node does not prevent sending to the others
+        agents['node-1'].send_async.reset_mock()
+        agents['node-2'].send_async.reset_mock()
+        agents['node-1'].send_async.side_effect = Exception
+        with self.assertRaises(Exception):
+            await self.grpc_server.broadcast(example_task)
         agents['node-2'].send_async.assert_called_once()
 
+        # No node: nothing to serialize
+        self.agent_store_mock.return_value.get_all.return_value = {}
+        with patch('fedbiomed.transport.server.Serializer.dumps_buffer') as dumps_buffer:
+            await self.grpc_server.broadcast(example_task)
+            dumps_buffer.assert_not_called()
+
 
     async def test_grpc_async_server_04_get_all_nodes(self):
 
@@ -278,8 +306,9 @@ class TestGrpcServer(unittest.IsolatedAsyncioTestCase):
         return super().tearDown()
 
 
-    @patch('fedbiomed.transport.server.GrpcServer.get_all_nodes')
-    def test_grpc_server_01_start(self, get_all_nodes):
+    @patch('fedbiomed.transport.server.time.sleep')
+    @patch('fedbiomed.transport.server.GrpcServer.wait_for_nodes')
+    def test_grpc_server_01_start(self, wait_for_nodes, sleep):
 
         self.grpc_server = GrpcServer(
             host='localhost',
@@ -294,22 +323,25 @@ class TestGrpcServer(unittest.IsolatedAsyncioTestCase):
         with patch("fedbiomed.transport.server.MAX_GRPC_SERVER_SETUP_TIMEOUT", 2):
             self.grpc_server.start()
 
+        self.grpc_server._thread.join()
         self.server_mock.return_value.start.assert_called_once()
         self.server_mock.return_value.wait_for_termination.assert_called_once()
-        self.grpc_server._thread.join()
+        # a node connected: return without waiting for other nodes
+        sleep.assert_not_called()
 
         self.server_mock.return_value.start.reset_mock()
         self.server_mock.return_value.wait_for_termination.reset_mock()
+        sleep.reset_mock()
         self.grpc_server._debug = True
 
 
-        get_all_nodes.side_effect = [ [], [1, 2]]
+        wait_for_nodes.return_value = False
         self.grpc_server.start()
 
+        self.grpc_server._thread.join()
         self.server_mock.return_value.start.assert_called_once()
         self.server_mock.return_value.wait_for_termination.assert_called_once()
-
-        self.grpc_server._thread.join()
+        sleep.assert_not_called()
 
 
     def test_grpc_server_02_send(self):
@@ -376,8 +408,6 @@ class TestGrpcServer(unittest.IsolatedAsyncioTestCase):
         result = self.grpc_server.get_node('node-id')
         self.assertEqual(result, 'test2')
 
-
-
     def test_grpc_server_05_is_alive(self):
 
         # Started is unset
@@ -388,6 +418,47 @@ class TestGrpcServer(unittest.IsolatedAsyncioTestCase):
         result = self.grpc_server.is_alive()
         self.assertFalse(result)
 
+    def test_grpc_server_06_wait_for_nodes(self):
+
+        # Started is unset
+        with self.assertRaises(FedbiomedCommunicationError):
+            self.grpc_server.wait_for_nodes(timeout=1)
+
+        self.grpc_server._is_started.set()
+        self.asyncio_mock.run_coroutine_threadsafe.return_value.result.return_value = True
+        result = self.grpc_server.wait_for_nodes(timeout=1)
+        self.assertTrue(result)
+
+    def test_grpc_server_07_run_threadsafe_timeout(self):
+
+        async def never_ends():
+            await asyncio.sleep(10)
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        self.addCleanup(loop.close)
+        self.addCleanup(thread.join)
+        self.addCleanup(loop.call_soon_threadsafe, loop.stop)
+        self.grpc_server._loop = loop
+
+        # coroutines really run in the event loop of the server thread
+        with patch('fedbiomed.transport.server.asyncio', asyncio):
+            with self.assertRaises(FedbiomedCommunicationError):
+                self.grpc_server._run_threadsafe(never_ends(), timeout=0.1)
+
+            # default timeout is the one given to the constructor
+            grpc_server = GrpcServer(
+                host='localhost',
+                port="50051",
+                ssl=self.ssl_credentials,
+                on_message=self.on_message,
+                call_timeout=0.1
+            )
+            grpc_server._loop = loop
+            with self.assertRaises(FedbiomedCommunicationError):
+                grpc_server._run_threadsafe(never_ends())
+
 
 if __name__ == "__main__":
     unittest.main()